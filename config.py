@@ -5,6 +5,8 @@ This module contains all configuration constants, physical parameters,
 and file specifications used throughout the analysis pipeline.
 """
 
+import numpy as np
+
 # ==============================================================================
 # PHYSICAL CONSTANTS
 # ==============================================================================
@@ -72,6 +74,30 @@ TERRAIN_THRESHOLDS = {
     5: (0.7, float('inf'))  # Urban
 }
 
+# Array form of TERRAIN_THRESHOLDS for vectorized classification
+# Upper bound of each terrain class (bins are (low, high]) and matching IDs
+TERRAIN_EDGES = np.array([high for low, high in TERRAIN_THRESHOLDS.values()])
+TERRAIN_IDS = np.array(list(TERRAIN_THRESHOLDS.keys()), dtype=np.int8)
+
+
+def classify_terrain(surface_roughness):
+    """
+    Classify surface roughness values into terrain IDs.
+
+    Parameters:
+    -----------
+    surface_roughness : array-like
+        Surface roughness values (nsi_val.SURFACEROU)
+
+    Returns:
+    --------
+    ndarray of int8
+        Terrain ID (1-5) for each value. Values at a class boundary fall in
+        the lower class; missing values are classified as urban (5).
+    """
+    sr = np.asarray(surface_roughness, dtype=float)
+    return TERRAIN_IDS[np.searchsorted(TERRAIN_EDGES[:-1], sr, side='left')]
+
 # ==============================================================================
 # HAZUS DATA FILES
 # ==============================================================================
@@ -122,12 +148,18 @@ BUILDING_SUBTYPE_RANGES = {
 # Checkpoint file for building characterization
 BUILDING_INVENTORY_CHECKPOINT = 'nsi_wbId_sr.csv'
 
+# Parquet copy of the checkpoint, preferred on reload (much faster than CSV)
+BUILDING_INVENTORY_PARQUET = 'nsi_wbId_sr.parquet'
+
 # Final aggregated loss results
 TOTAL_LOSS_OUTPUT = 'TotalLoss.csv'
 
 # Individual building losses filename pattern
 BUILDING_LOSSES_PATTERN = 'Losses.csv'
 
+# Parquet copy of each scenario's losses, read by the county aggregation
+BUILDING_LOSSES_PARQUET = 'Losses.parquet'
+
 # ==============================================================================
 # NETCDF VARIABLE NAMES
 # ==============================================================================
@@ -156,3 +188,13 @@ NSI_COLUMNS = {
     'structure_value': 'val_struct',    # Structural replacement value
     'contents_value': 'val_cont'        # Contents replacement value
 }
+
+# NSI columns read by Step 3A (building characterization); replacement values
+# are taken from the joined data in Step 3B instead
+CHARACTERIZATION_COLUMNS = [
+    NSI_COLUMNS['foundation_id'],
+    NSI_COLUMNS['county_fips'],
+    NSI_COLUMNS['occupancy'],
+    NSI_COLUMNS['building_type'],
+    NSI_COLUMNS['surface_roughness']
+]
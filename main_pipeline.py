@@ -20,15 +20,72 @@ import os
 import sys
 import argparse
 import logging
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-import config
-from modules import netcdf_processor, spatial_join, building_losses
+from functools import lru_cache
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from pathlib import Path
+
+# Banner separator for log section headers
+_SEP = "=" * 70
+
+
+@dataclass(frozen=True)
+class PipelineLayout:
+    """
+    Output directory layout of a pipeline run.
+
+    Built once from --output-dir so every step resolves its directories and
+    per-scenario files the same way.
+
+    Attributes:
+    -----------
+    wind_dir : Path
+        Step 1 outputs (processed_wind/)
+    joined_dir : Path
+        Step 2 outputs (joined_data/)
+    inventory_dir : Path
+        Step 3A checkpoint (building_inventory/)
+    results_dir : Path
+        Step 3B-3C outputs (results/)
+    """
+    wind_dir: Path
+    joined_dir: Path
+    inventory_dir: Path
+    results_dir: Path
+
+    @classmethod
+    def from_output_dir(cls, output_dir):
+        """Build the layout rooted at the given output directory."""
+        root = Path(output_dir)
+        return cls(
+            wind_dir=root / 'processed_wind',
+            joined_dir=root / 'joined_data',
+            inventory_dir=root / 'building_inventory',
+            results_dir=root / 'results'
+        )
+
+    def wind_csv(self, scenario):
+        """Path of a scenario's processed wind CSV (Step 1)."""
+        return self.wind_dir / f"{scenario}.csv"
+
+    def joined_csv(self, scenario):
+        """Path of a scenario's joined building/wind CSV (Step 2)."""
+        return self.joined_dir / scenario / f"{scenario}.csv"
 
 
 def setup_logging(output_dir):
     """
     Set up logging to both console and file.
 
+    Log calls only enqueue the record; a background QueueListener thread
+    formats and writes it, and file writes are batched through a
+    MemoryHandler (flushed every 1024 records or on ERROR).
+
     Parameters:
     -----------
     output_dir : str
@@ -36,8 +93,9 @@ def setup_logging(output_dir):
 
     Returns:
     --------
-    str
-        Path to the created log file
+    tuple of (str, QueueListener)
+        Path to the created log file, and the running listener. Call
+        stop_logging(listener) before exiting to flush pending records.
     """
     # Create logs directory
     logs_dir = os.path.join(output_dir, '../logs')
@@ -63,25 +121,137 @@ def setup_logging(output_dir):
         '%(levelname)-8s | %(message)s'
     )
 
-    # File handler
+    # File handler (writes batched through a memory buffer)
     file_handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    buffered_file_handler = MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
 
-    return log_file
+    # Queue handler on the root logger; the listener thread owns the real handlers
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, buffered_file_handler, console_handler,
+                             respect_handler_level=True)
+    listener.start()
+
+    return log_file, listener
+
+
+def stop_logging(listener):
+    """
+    Stop the logging listener, flush buffered records to disk and close the
+    handlers setup_logging created, so the log file is released and a later
+    setup_logging call starts clean.
+
+    Parameters:
+    -----------
+    listener : QueueListener
+        Listener returned by setup_logging
+    """
+    listener.stop()
+    for handler in listener.handlers:
+        # MemoryHandler.close() flushes to its target but leaves it open
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
+    listener.handlers = ()
+
+    logger = logging.getLogger()
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            logger.removeHandler(handler)
+            handler.close()
+
+
+@lru_cache(maxsize=32)
+def _dir_entries(path):
+    """
+    Return the names of the entries in a directory (cached).
+
+    Call _dir_entries.cache_clear() after a step writes new outputs.
+
+    Parameters:
+    -----------
+    path : str
+        Directory to list
+
+    Returns:
+    --------
+    frozenset of str
+        Entry names, or an empty set if the directory does not exist
+    """
+    try:
+        return frozenset(os.listdir(path))
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
+
+def _init_worker_logging(log_queue):
+    """
+    Route log records from a worker process to the parent's log handlers.
+
+    Parameters:
+    -----------
+    log_queue : multiprocessing.Queue
+        Queue drained by a QueueListener in the parent process
+    """
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.handlers = [QueueHandler(log_queue)]
+
+
+@contextmanager
+def scenario_executor(max_workers):
+    """
+    Create a process pool for running the climate scenarios in parallel.
+
+    Workers are started with the 'spawn' method to avoid fork-after-thread
+    problems in GDAL/HDF5, and their log records are forwarded through a
+    queue to the parent's handlers. Each record is written as one whole
+    line, but lines from concurrently running scenarios still interleave.
+
+    Parameters:
+    -----------
+    max_workers : int
+        Number of worker processes. Values <= 1 disable parallelism.
+
+    Yields:
+    -------
+    ProcessPoolExecutor or None
+        Executor to pass to the pipeline steps, or None to run sequentially
+    """
+    if max_workers <= 1:
+        yield None
+        return
+
+    ctx = multiprocessing.get_context('spawn')
+    log_queue = ctx.Queue()
+    listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+    listener.start()
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx,
+                                 initializer=_init_worker_logging,
+                                 initargs=(log_queue,)) as executor:
+            yield executor
+    finally:
+        listener.stop()
 
 
 def validate_inputs(args):
     """
     Validate all input paths and files exist.
 
+    The filesystem checks are issued concurrently from a thread pool so their
+    latency overlaps on network mounts; results are reported in a fixed order.
+
     Parameters:
     -----------
     args : argparse.Namespace
@@ -92,81 +262,101 @@ def validate_inputs(args):
     FileNotFoundError
         If any required input files or directories are missing
     """
+    import config
+
     logger = logging.getLogger(__name__)
 
-    logger.info("="*70)
+    logger.info(_SEP)
     logger.info("INPUT VALIDATION")
-    logger.info("="*70)
+    logger.info(_SEP)
 
     errors = []
 
+    # Run the path checks (and warm the directory listings) concurrently
+    checks = {
+        'ncar_dir': (os.path.isdir, args.ncar_dir),
+        'nsi_path': (os.path.exists, args.nsi_path),
+        'hazus_dir': (os.path.isdir, args.hazus_dir),
+        'ncar_entries': (_dir_entries, args.ncar_dir),
+        'hazus_entries': (_dir_entries, args.hazus_dir)
+    }
+    if args.building_inventory:
+        # Present if the CSV or its Parquet copy exists (either can be loaded)
+        checks['building_inventory'] = (
+            lambda path: (os.path.exists(path)
+                          or os.path.exists(os.path.splitext(path)[0] + '.parquet')),
+            args.building_inventory)
+    with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        futures = {label: pool.submit(check, path) for label, (check, path) in checks.items()}
+    found = {label: future.result() for label, future in futures.items()}
+
     # Check NCAR directory
-    logger.info(f"\nChecking NCAR NetCDF directory: {args.ncar_dir}")
-    if not os.path.exists(args.ncar_dir):
+    logger.info("\nChecking NCAR NetCDF directory: %s", args.ncar_dir)
+    if not found['ncar_dir']:
         errors.append(f"NCAR directory not found: {args.ncar_dir}")
-        logger.error(f"  ✗ Directory not found")
+        logger.error("  ✗ Directory not found")
     else:
-        logger.info(f"  ✓ Directory exists")
-        # Check for NetCDF files
+        logger.info("  ✓ Directory exists")
+        # Check for NetCDF files (one directory listing instead of a stat per file)
         for nc_file in config.NETCDF_FILES:
             nc_path = os.path.join(args.ncar_dir, nc_file)
-            if not os.path.exists(nc_path):
+            if nc_file not in found['ncar_entries']:
                 errors.append(f"NetCDF file not found: {nc_path}")
-                logger.error(f"    ✗ Missing: {nc_file}")
+                logger.error("    ✗ Missing: %s", nc_file)
             else:
-                logger.info(f"    ✓ Found: {nc_file}")
+                logger.info("    ✓ Found: %s", nc_file)
 
     # Check NSI file
-    logger.info(f"\nChecking NSI building inventory: {args.nsi_path}")
-    if not os.path.exists(args.nsi_path):
+    logger.info("\nChecking NSI building inventory: %s", args.nsi_path)
+    if not found['nsi_path']:
         errors.append(f"NSI file not found: {args.nsi_path}")
-        logger.error(f"  ✗ File not found")
+        logger.error("  ✗ File not found")
     else:
-        logger.info(f"  ✓ File exists")
+        logger.info("  ✓ File exists")
 
     # Check Hazus directory
-    logger.info(f"\nChecking Hazus directory: {args.hazus_dir}")
-    if not os.path.exists(args.hazus_dir):
+    logger.info("\nChecking Hazus directory: %s", args.hazus_dir)
+    if not found['hazus_dir']:
         errors.append(f"Hazus directory not found: {args.hazus_dir}")
-        logger.error(f"  ✗ Directory not found")
+        logger.error("  ✗ Directory not found")
     else:
-        logger.info(f"  ✓ Directory exists")
-        # Check for Hazus files
+        logger.info("  ✓ Directory exists")
+        # Check for Hazus files (one directory listing instead of a stat per file)
         for file_type, filename in config.HAZUS_FILES.items():
             hazus_path = os.path.join(args.hazus_dir, filename)
-            if not os.path.exists(hazus_path):
+            if filename not in found['hazus_entries']:
                 errors.append(f"Hazus {file_type} file not found: {hazus_path}")
-                logger.error(f"    ✗ Missing: {filename}")
+                logger.error("    ✗ Missing: %s", filename)
             else:
-                logger.info(f"    ✓ Found: {filename}")
+                logger.info("    ✓ Found: %s", filename)
 
     # Check building inventory if provided
     if args.building_inventory:
-        logger.info(f"\nChecking building inventory checkpoint: {args.building_inventory}")
-        if not os.path.exists(args.building_inventory):
+        logger.info("\nChecking building inventory checkpoint: %s", args.building_inventory)
+        if not found['building_inventory']:
             errors.append(f"Building inventory file not found: {args.building_inventory}")
-            logger.error(f"  ✗ File not found")
+            logger.error("  ✗ File not found")
         else:
-            logger.info(f"  ✓ File exists (will use for Step 3)")
+            logger.info("  ✓ File exists (will use for Step 3)")
 
     # Report errors
     if errors:
-        logger.error(f"\n{'='*70}")
+        logger.error(f"\n{_SEP}")
         logger.error("VALIDATION FAILED")
-        logger.error(f"{'='*70}")
-        logger.error(f"\nFound {len(errors)} error(s):")
+        logger.error(_SEP)
+        logger.error("\nFound %s error(s):", len(errors))
         for i, error in enumerate(errors, 1):
-            logger.error(f"  {i}. {error}")
-        logger.error(f"\nPlease ensure all required data files are available.")
-        logger.error(f"See README.md for data requirements and sources.")
+            logger.error("  %s. %s", i, error)
+        logger.error("\nPlease ensure all required data files are available.")
+        logger.error("See README.md for data requirements and sources.")
         raise FileNotFoundError(f"Missing required input files ({len(errors)} errors)")
 
-    logger.info(f"\n{'='*70}")
+    logger.info(f"\n{_SEP}")
     logger.info("VALIDATION SUCCESSFUL - All required files found")
-    logger.info(f"{'='*70}\n")
+    logger.info(f"{_SEP}\n")
 
 
-def run_pipeline(args):
+def run_pipeline(args, layout, executor=None):
     """
     Execute the full analysis pipeline.
 
@@ -174,101 +364,109 @@ def run_pipeline(args):
     -----------
     args : argparse.Namespace
         Parsed command-line arguments
+    layout : PipelineLayout
+        Output directory layout for this run
+    executor : concurrent.futures.Executor, optional
+        Executor used to run the scenarios of Steps 1, 2 and 3B in parallel
+        (see scenario_executor). Default is None (run sequentially).
 
     Returns:
     --------
     dict
         Dictionary containing paths to all output files
     """
+    import config
+
     logger = logging.getLogger(__name__)
 
     # Determine which steps to run
     if args.steps:
         steps_to_run = [int(s.strip()) for s in args.steps.split(',')]
-        logger.info(f"Running selected steps: {steps_to_run}")
+        logger.info("Running selected steps: %s", steps_to_run)
     else:
         steps_to_run = [1, 2, 3]
-        logger.info(f"Running all steps: {steps_to_run}")
+        logger.info("Running all steps: %s", steps_to_run)
 
     outputs = {}
 
     # STEP 1: Process NCAR NetCDF files
     if 1 in steps_to_run:
-        wind_output_dir = os.path.join(args.output_dir, 'processed_wind')
-        os.makedirs(wind_output_dir, exist_ok=True)
+        from modules import netcdf_processor
 
         wind_csv_paths = netcdf_processor.process_ncar_netcdf(
             ncar_dir=args.ncar_dir,
-            output_dir=wind_output_dir,
-            force_rerun=args.force_rerun
+            output_dir=str(layout.wind_dir),
+            force_rerun=args.force_rerun,
+            executor=executor
         )
+        _dir_entries.cache_clear()
         outputs['wind_csvs'] = wind_csv_paths
     else:
         # If step 1 skipped, need to find existing wind CSVs
         logger.info("Step 1 skipped - looking for existing wind CSV files...")
-        wind_output_dir = os.path.join(args.output_dir, 'processed_wind')
         wind_csv_paths = {}
         for scenario in config.SCENARIOS:
-            csv_path = os.path.join(wind_output_dir, f"{scenario}.csv")
-            if os.path.exists(csv_path):
-                wind_csv_paths[scenario] = csv_path
-                logger.info(f"  Found: {csv_path}")
+            csv_path = layout.wind_csv(scenario)
+            if csv_path.name in _dir_entries(csv_path.parent):
+                wind_csv_paths[scenario] = str(csv_path)
+                logger.info("  Found: %s", csv_path)
             else:
-                logger.error(f"  Missing: {csv_path}")
+                logger.error("  Missing: %s", csv_path)
                 raise FileNotFoundError(f"Wind CSV not found (run with step 1): {csv_path}")
         outputs['wind_csvs'] = wind_csv_paths
 
     # STEP 2: Spatial join
     if 2 in steps_to_run:
-        joined_output_dir = os.path.join(args.output_dir, 'joined_data')
-        os.makedirs(joined_output_dir, exist_ok=True)
+        from modules import spatial_join
 
         joined_csv_paths = spatial_join.join_buildings_wind(
             nsi_path=args.nsi_path,
             wind_csv_paths=outputs['wind_csvs'],
-            output_dir=joined_output_dir,
-            force_rerun=args.force_rerun
+            output_dir=str(layout.joined_dir),
+            force_rerun=args.force_rerun,
+            executor=executor
         )
+        _dir_entries.cache_clear()
         outputs['joined_csvs'] = joined_csv_paths
     else:
         # If step 2 skipped, need to find existing joined CSVs
         logger.info("Step 2 skipped - looking for existing joined CSV files...")
-        joined_output_dir = os.path.join(args.output_dir, 'joined_data')
         joined_csv_paths = {}
         for scenario in config.SCENARIOS:
-            csv_path = os.path.join(joined_output_dir, scenario, f"{scenario}.csv")
-            if os.path.exists(csv_path):
-                joined_csv_paths[scenario] = csv_path
-                logger.info(f"  Found: {csv_path}")
+            csv_path = layout.joined_csv(scenario)
+            if csv_path.name in _dir_entries(csv_path.parent):
+                joined_csv_paths[scenario] = str(csv_path)
+                logger.info("  Found: %s", csv_path)
             else:
-                logger.error(f"  Missing: {csv_path}")
+                logger.error("  Missing: %s", csv_path)
                 raise FileNotFoundError(f"Joined CSV not found (run with step 2): {csv_path}")
         outputs['joined_csvs'] = joined_csv_paths
 
     # STEP 3: Loss calculation
     if 3 in steps_to_run:
-        inventory_output_dir = os.path.join(args.output_dir, 'building_inventory')
-        results_output_dir = os.path.join(args.output_dir, 'results')
-        os.makedirs(inventory_output_dir, exist_ok=True)
-        os.makedirs(results_output_dir, exist_ok=True)
+        from modules import building_losses
 
         # Step 3A: Building characterization (with checkpointing)
         if args.building_inventory:
             # Use provided checkpoint
-            logger.info(f"Using provided building inventory: {args.building_inventory}")
-            import pandas as pd
-            building_inventory = pd.read_csv(args.building_inventory)
+            logger.info("Using provided building inventory: %s", args.building_inventory)
+            building_inventory = building_losses.load_building_inventory(args.building_inventory)
         else:
             # Run characterization (or load checkpoint if exists)
             # Need to load NSI data from one of the joined files
             import pandas as pd
-            first_scenario = list(outputs['joined_csvs'].keys())[0]
-            nsi_data = pd.read_csv(outputs['joined_csvs'][first_scenario])
+            first_scenario = next(iter(outputs['joined_csvs']))
+            joined_csv = outputs['joined_csvs'][first_scenario]
+
+            # Only the attributes characterization uses are loaded
+            nsi_data = pd.read_csv(joined_csv, engine='pyarrow',
+                                   usecols=config.CHARACTERIZATION_COLUMNS,
+                                   dtype_backend='pyarrow')
 
             building_inventory = building_losses.characterize_buildings(
                 nsi_data=nsi_data,
                 hazus_dir=args.hazus_dir,
-                output_dir=inventory_output_dir,
+                output_dir=str(layout.inventory_dir),
                 force_rerun=args.force_rerun
             )
 
@@ -279,18 +477,20 @@ def run_pipeline(args):
             building_inventory=building_inventory,
             joined_data_paths=outputs['joined_csvs'],
             hazus_dir=args.hazus_dir,
-            output_dir=results_output_dir,
-            force_rerun=args.force_rerun
+            output_dir=str(layout.results_dir),
+            force_rerun=args.force_rerun,
+            executor=executor
         )
         outputs['loss_csvs'] = loss_csv_paths
 
         # Step 3C: Aggregate to county level
         total_loss_csv = building_losses.aggregate_county_losses(
             loss_data_paths=loss_csv_paths,
-            output_dir=results_output_dir,
+            output_dir=str(layout.results_dir),
             force_rerun=args.force_rerun
         )
         outputs['total_loss_csv'] = total_loss_csv
+        _dir_entries.cache_clear()
 
     return outputs
 
@@ -360,26 +560,41 @@ For more information, see README.md
         help='Force reprocessing even if output files already exist'
     )
 
-    # Parse arguments
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=None,
+        help='Number of worker processes for running scenarios in parallel '
+             '(default: one per scenario; use 1 to run sequentially)'
+    )
+
+    # Parse arguments (before importing config so --help returns immediately)
     args = parser.parse_args()
 
-    # Create output directory
+    import config
+    if args.max_workers is None:
+        args.max_workers = len(config.SCENARIOS)
+
+    # Create output directory and its step subdirectories
     os.makedirs(args.output_dir, exist_ok=True)
+    layout = PipelineLayout.from_output_dir(args.output_dir)
+    for step_dir in (layout.wind_dir, layout.joined_dir, layout.inventory_dir, layout.results_dir):
+        os.makedirs(step_dir, exist_ok=True)
 
     # Set up logging
-    log_file = setup_logging(args.output_dir)
+    log_file, listener = setup_logging(args.output_dir)
 
     # Get logger for main module
     logger = logging.getLogger(__name__)
 
     # Print header
     logger.info("")
-    logger.info("="*70)
+    logger.info(_SEP)
     logger.info("HURRICANE IDA WIND LOSS ANALYSIS PIPELINE")
-    logger.info("="*70)
+    logger.info(_SEP)
     logger.info(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     logger.info(f"Log file: {log_file}")
-    logger.info("="*70)
+    logger.info(_SEP)
 
     # Log configuration
     logger.info("\nPipeline Configuration:")
@@ -390,6 +605,7 @@ For more information, see README.md
     logger.info(f"  Building inventory: {args.building_inventory or 'Will compute/load checkpoint'}")
     logger.info(f"  Steps to run: {args.steps or 'All (1,2,3)'}")
     logger.info(f"  Force rerun: {args.force_rerun}")
+    logger.info(f"  Max workers: {args.max_workers}")
     logger.info("")
 
     try:
@@ -400,15 +616,16 @@ For more information, see README.md
         start_time = datetime.now()
         logger.info(f"Starting pipeline execution at {start_time.strftime('%H:%M:%S')}\n")
 
-        outputs = run_pipeline(args)
+        with scenario_executor(args.max_workers) as executor:
+            outputs = run_pipeline(args, layout, executor)
 
         end_time = datetime.now()
         elapsed = end_time - start_time
 
         # Print summary
-        logger.info("="*70)
+        logger.info(_SEP)
         logger.info("PIPELINE COMPLETED SUCCESSFULLY")
-        logger.info("="*70)
+        logger.info(_SEP)
         logger.info(f"End time: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info(f"Total elapsed time: {elapsed}")
         logger.info(f"\nOutput files:")
@@ -428,20 +645,23 @@ For more information, see README.md
             logger.info(f"  Total losses: {outputs['total_loss_csv']}")
 
         logger.info(f"\nLog file: {log_file}")
-        logger.info("="*70)
+        logger.info(_SEP)
 
         return 0
 
     except Exception as e:
         logger.error("")
-        logger.error("="*70)
+        logger.error(_SEP)
         logger.error("PIPELINE FAILED")
-        logger.error("="*70)
+        logger.error(_SEP)
         logger.error(f"Error: {str(e)}")
         logger.error(f"\nCheck log file for details: {log_file}")
-        logger.error("="*70)
+        logger.error(_SEP)
         return 1
 
+    finally:
+        stop_logging(listener)
+
 
 if __name__ == '__main__':
     sys.exit(main())
@@ -11,8 +11,24 @@ Modules:
 - building_losses : Calculate building-level and county-level wind losses
 """
 
-from . import netcdf_processor
-from . import spatial_join
-from . import building_losses
+import importlib
 
 __all__ = ['netcdf_processor', 'spatial_join', 'building_losses']
+
+
+def __getattr__(name):
+    """
+    Import submodules on first access (PEP 562).
+
+    Each submodule pulls in heavy dependencies (netCDF4, geopandas, ...), so
+    `from modules import netcdf_processor` only loads the one requested.
+    """
+    if name in __all__:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
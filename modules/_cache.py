@@ -0,0 +1,65 @@
+"""
+Parquet Cache Validation Helpers
+
+Slow-to-read inputs (Hazus mapping sheets, projected NSI buildings) are cached
+as Parquet. Each cache stores the absolute path, size and modification time of
+the file it was built from (as DataFrame.attrs, which pandas and geopandas keep
+in the Parquet schema metadata), and is reused only while all three still match.
+
+Functions:
+----------
+source_stamp : Identify a source file by absolute path, size and mtime
+cached_source : Read the source stamp stored in a Parquet cache
+"""
+
+import os
+import json
+import logging
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+
+def source_stamp(path):
+    """
+    Identify a source file by its absolute path, size and modification time.
+
+    Parameters:
+    -----------
+    path : str
+        Source file path
+
+    Returns:
+    --------
+    dict
+        {'path': str, 'size': int, 'mtime_ns': int}
+    """
+    stat = os.stat(path)
+    return {'path': os.path.abspath(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def cached_source(cache_path):
+    """
+    Read the source stamp stored in a Parquet cache without loading its data.
+
+    Parameters:
+    -----------
+    cache_path : str
+        Path to the Parquet cache
+
+    Returns:
+    --------
+    dict or None
+        Stamp written by source_stamp, or None if the cache is missing,
+        unreadable or has no stamp
+    """
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+        attrs = json.loads(metadata.get(b'PANDAS_ATTRS', b'{}'))
+    except (OSError, ValueError):
+        return None
+    if 'source' not in attrs:
+        # pandas < 2.1 (and older geopandas) drop DataFrame.attrs when writing
+        # Parquet, so such a cache can never be validated against its source
+        logger.warning(f"  ⚠ Cache has no source stamp and will not be reused: {cache_path}")
+    return attrs.get('source')
@@ -7,6 +7,8 @@ loss calculation for wind hazard analysis using Hazus methodology.
 Functions:
 ----------
 characterize_buildings : Assign Hazus building types to NSI buildings (with checkpointing)
+load_building_inventory : Load a building characterization checkpoint
+resolve_inventory_path : File a checkpoint path is actually read from (CSV or Parquet copy)
 calculate_building_losses : Calculate individual building wind losses
 aggregate_county_losses : Aggregate losses to county level
 """
@@ -16,6 +18,7 @@ import logging
 import numpy as np
 import pandas as pd
 import config
+from modules._cache import source_stamp, cached_source
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +36,9 @@ def characterize_buildings(nsi_data, hazus_dir, output_dir, force_rerun=False):
     Parameters:
     -----------
     nsi_data : str or DataFrame
-        Path to NSI CSV file or DataFrame containing NSI building data
+        Path to NSI CSV file or DataFrame containing NSI building data. Only
+        config.CHARACTERIZATION_COLUMNS (fd_id, cbfips, occtype, bldgtype,
+        nsi_val.SURFACEROU) are required; other columns are carried through.
     hazus_dir : str
         Directory containing Hazus mapping files (Mapping.xlsx, huDamLossFunc.csv)
     output_dir : str
@@ -58,6 +63,8 @@ def characterize_buildings(nsi_data, hazus_dir, output_dir, force_rerun=False):
     Checkpointing:
     --------------
     - Checkpoint file: {output_dir}/nsi_wbId_sr.csv
+    - Parquet copy: {output_dir}/nsi_wbId_sr.parquet (preferred when loading;
+      either file alone counts as an existing checkpoint)
     - If checkpoint exists and force_rerun=False: Load and return (FAST ~seconds)
     - If checkpoint missing or force_rerun=True: Run full characterization (SLOW ~30-60 min)
 
@@ -72,7 +79,7 @@ def characterize_buildings(nsi_data, hazus_dir, output_dir, force_rerun=False):
           - Select appropriate subtype names
           - Assign building characteristics (shutters, garage, etc.)
        d. Match building characteristics to wind building type (wbID)
-    3. Calculate terrain ID from surface roughness
+    3. Calculate terrain ID from surface roughness (all buildings in one pass)
     4. Save checkpoint file
 
     Building Type Mapping:
@@ -96,7 +103,7 @@ def characterize_buildings(nsi_data, hazus_dir, output_dir, force_rerun=False):
     ------
     - Uses random seed {config.RANDOM_SEED} for reproducibility
     - All probabilistic assignments are deterministic given the seed
-    - Checkpoint file contains full NSI dataset with wbID and terrainID added
+    - Checkpoint file contains the input NSI columns with wbID and terrainID added
 
     Example:
     --------
@@ -115,15 +122,20 @@ def characterize_buildings(nsi_data, hazus_dir, output_dir, force_rerun=False):
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
 
-    # Define checkpoint path
+    # Define checkpoint paths
     checkpoint_path = os.path.join(output_dir, config.BUILDING_INVENTORY_CHECKPOINT)
+    parquet_path = os.path.join(output_dir, config.BUILDING_INVENTORY_PARQUET)
 
-    # Check for existing checkpoint
-    if os.path.exists(checkpoint_path) and not force_rerun:
+    # Check for existing checkpoint (either the CSV or its Parquet copy)
+    if (os.path.exists(checkpoint_path) or os.path.exists(parquet_path)) and not force_rerun:
         logger.info(f"✓ Loading existing building characterization checkpoint")
-        logger.info(f"  File: {checkpoint_path}")
+        inventory_path = resolve_inventory_path(checkpoint_path)
+        logger.info(f"  File: {inventory_path}")
         try:
-            building_data = pd.read_csv(checkpoint_path)
+            building_data = _read_inventory(inventory_path)
+            if inventory_path == checkpoint_path:
+                _write_inventory_parquet(building_data, checkpoint_path, parquet_path)
+                logger.info(f"  Wrote Parquet copy for faster reloads: {parquet_path}")
             logger.info(f"  Loaded {len(building_data):,} buildings")
             logger.info(f"  Columns: {list(building_data.columns)}")
             logger.info(f"\n⚡ Using cached characterization (skipped ~30-60 min processing)")
@@ -139,9 +151,9 @@ def characterize_buildings(nsi_data, hazus_dir, output_dir, force_rerun=False):
     # Load NSI data
     if isinstance(nsi_data, str):
         logger.info(f"Loading NSI data: {nsi_data}")
-        nsi_cb = pd.read_csv(nsi_data)
+        nsi_cb = pd.read_csv(nsi_data, usecols=config.CHARACTERIZATION_COLUMNS)
     else:
-        nsi_cb = nsi_data.copy()
+        nsi_cb = nsi_data.reset_index(drop=True)
 
     logger.info(f"  ✓ Loaded {len(nsi_cb):,} buildings")
 
@@ -154,17 +166,17 @@ def characterize_buildings(nsi_data, hazus_dir, output_dir, force_rerun=False):
     logger.info(f"  File: {mapping_file}")
 
     try:
-        # Load Hazus mapping tables
-        huMappingSchemesByCountyFips = pd.read_excel(
-            mapping_file, sheet_name=config.HAZUS_SHEETS['county_mapping'])
-        huGbsOccMapping = pd.read_excel(
-            mapping_file, sheet_name=config.HAZUS_SHEETS['occ_mapping'])
-        huBldgMapping = pd.read_excel(
-            mapping_file, sheet_name=config.HAZUS_SHEETS['bldg_mapping'])
-        huListofBldgChar = pd.read_excel(
-            mapping_file, sheet_name=config.HAZUS_SHEETS['bldg_char'])
-        huListOfWindBldgTypes = pd.read_excel(
-            mapping_file, sheet_name=config.HAZUS_SHEETS['wind_types'])
+        # Load Hazus mapping tables (cached as Parquet next to the checkpoint)
+        huMappingSchemesByCountyFips = _read_mapping_sheet(
+            mapping_file, config.HAZUS_SHEETS['county_mapping'], output_dir, force_rerun)
+        huGbsOccMapping = _read_mapping_sheet(
+            mapping_file, config.HAZUS_SHEETS['occ_mapping'], output_dir, force_rerun)
+        huBldgMapping = _read_mapping_sheet(
+            mapping_file, config.HAZUS_SHEETS['bldg_mapping'], output_dir, force_rerun)
+        huListofBldgChar = _read_mapping_sheet(
+            mapping_file, config.HAZUS_SHEETS['bldg_char'], output_dir, force_rerun)
+        huListOfWindBldgTypes = _read_mapping_sheet(
+            mapping_file, config.HAZUS_SHEETS['wind_types'], output_dir, force_rerun)
 
         logger.info(f"  ✓ Loaded all Hazus mapping tables")
 
@@ -176,14 +188,40 @@ def characterize_buildings(nsi_data, hazus_dir, output_dir, force_rerun=False):
     charTypes = [i for i in huListofBldgChar['CharType'].unique()]
     logger.info(f"  Building characteristic types: {len(charTypes)}")
 
+    # Characteristic IDs and names per type, looked up once instead of per subtype
+    char_ids = {}
+    char_id_sets = {}
+    char_names = {}
+    for charType in charTypes:
+        main = huListofBldgChar.loc[huListofBldgChar['CharType']==charType]
+        char_ids[charType] = main['BldgCharID'].to_numpy()
+        char_id_sets[charType] = set(char_ids[charType].tolist())
+        char_names[charType] = main['BldgChar'].tolist()
+
+    # Mapping tables split once by their lookup keys (dict lookups in the loop)
+    county_first = huMappingSchemesByCountyFips.drop_duplicates('CountyFIPS')
+    county_schemes = dict(zip(county_first['CountyFIPS'], county_first['huBldgSchemeName']))
+    huOccMap_groups = dict(list(huGbsOccMapping.groupby('huOccMapSchemeName', sort=False)))
+    huBldg_groups = dict(list(huBldgMapping.groupby(['huBldgSchemeName', 'sbtName'], sort=False)))
+    char_dist_cache = {}
+
     # Create county FIPS column
     logger.info(f"\nPreparing county-level processing...")
-    nsi_cb['countyFIPS'] = nsi_cb['cbfips'].astype(str).str[:5]
-    cfips = [str(io) for i in nsi_cb['countyFIPS'].unique()]
-    logger.info(f"  Counties to process: {len(cfips)}")
-
-    # Initialize building list for results
-    building_list = []
+    nsi_cb['countyFIPS'] = _county_fips(nsi_cb['cbfips'])
+    n_counties = nsi_cb['countyFIPS'].nunique()
+    logger.info(f"  Counties to process: {n_counties}")
+
+    # Terrain ID depends only on surface roughness: classify all buildings at once
+    nsi_cb['terrainID'] = config.classify_terrain(
+        nsi_cb['nsi_val.SURFACEROU'].to_numpy(dtype=float, na_value=np.nan))
+
+    # Results are written by row position into preallocated columns; `order`
+    # records the characterized rows in processing order
+    n_buildings = len(nsi_cb)
+    sbt_arr = np.full(n_buildings, pd.NA, dtype=object)
+    char_arrs = {charType: np.full(n_buildings, pd.NA, dtype=object) for charType in charTypes}
+    wbID_arr = pd.array(np.zeros(n_buildings, dtype=np.int64), dtype='Int64')
+    order = []
     seed = config.RANDOM_SEED
     np.random.seed(seed)
 
@@ -192,32 +230,29 @@ def characterize_buildings(nsi_data, hazus_dir, output_dir, force_rerun=False):
     logger.info(f"  This will process all counties, occupancy types, and building types")
     logger.info(f"  Progress updates every 10 counties...\n")
 
-    # Main characterization loop
+    # Main characterization loop (groupby splits each level in one pass,
+    # in order of first appearance)
     county_count = 0
-    for cfip in cfips:
+    for cfip, df0 in nsi_cb.groupby('countyFIPS', sort=False):
         county_count += 1
 
         # Progress logging
         if county_count % 10 == 0:
-            logger.info(f"  Processed {county_count}/{len(cfips)} counties...")
-
-        df0 = nsi_cb.loc[nsi_cb['countyFIPS']==str(cfip)].copy()
+            logger.info(f"  Processed {county_count}/{n_counties} counties...")
 
         # Get Hazus building scheme for this county
         try:
-            huBldgSchemeName = huMappingSchemesByCountyFips[
-                huMappingSchemesByCountyFips['CountyFIPS']==int(cfip)
-            ].iloc[0]['huBldgSchemeName']
-        except:
+            huBldgSchemeName = county_schemes[int(cfip)]
+        except (KeyError, ValueError):
             logger.warning(f"  ⚠ No mapping scheme for county {cfip}, skipping...")
             continue
 
-        huOccMap = huGbsOccMapping[huGbsOccMapping['huOccMapSchemeName']==huBldgSchemeName]
+        huOccMap = huOccMap_groups.get(huBldgSchemeName)
+        if huOccMap is None:
+            continue
 
         # Process each occupancy type
-        occtypes = [i for i in df0['occtype'].unique()]
-        for occ in occtypes:
-            df1 = df0.loc[df0['occtype']==occ].copy()
+        for occ, df1 in df0.groupby('occtype', sort=False):
 
             # Handle occupancy suffix
             if '-' in occ:
@@ -231,9 +266,7 @@ def characterize_buildings(nsi_data, hazus_dir, output_dir, force_rerun=False):
             Occschemes = huOcc.columns[2:]
 
             # Process each building type
-            bldgTypes = [i for i in df1['bldgtype'].unique()]
-            for bldgType in bldgTypes:
-                df2 = df1.loc[df1['bldgtype']==bldgType].copy()
+            for bldgType, df2 in df1.groupby('bldgtype', sort=False):
 
                 # Select subtype names based on building type
                 if bldgType == 'W':
@@ -249,119 +282,67 @@ def characterize_buildings(nsi_data, hazus_dir, output_dir, force_rerun=False):
                 else:
                     continue
 
-                # Probabilistic subtype assignment
+                # Probabilistic subtype assignment (one draw per building; the
+                # same draws as sampling one building at a time after reseeding)
                 OccMapProb = [i/100 for i in huOcc[sbtNames].values.flatten().tolist()]
 
-                df2['sbtName'] = pd.NA
                 np.random.seed(seed)
-                df2['sbtName'] = df2['sbtName'].apply(
-                    lambda x: np.random.choice(sbtNames, p=OccMapProb))
+                sbt_draws = np.random.choice(sbtNames, size=len(df2), p=OccMapProb)
+                sbt_arr[df2.index] = sbt_draws
 
                 # Process each subtype
-                sbts = [i for i in df2['sbtName'].unique()]
-                for sbt in sbts:
-                    df3 = df2.loc[df2['sbtName']==sbt].copy()
-
-                    huBldg = huBldgMapping.loc[
-                        (huBldgMapping['huBldgSchemeName']==huBldgSchemeName) &
-                        (huBldgMapping['sbtName']==sbt)
-                    ].copy()
-
-                    if len(huBldg) == 0:
+                for sbt, df3 in df2.groupby(sbt_draws, sort=False):
+                    pos = df3.index.to_numpy()
+
+                    # Characteristic distributions depend only on (scheme, subtype),
+                    # so they are derived the first time the pair is seen and reused
+                    key = (huBldgSchemeName, sbt)
+                    if key not in char_dist_cache:
+                        huBldg = huBldg_groups.get(key)
+                        char_dist_cache[key] = None if huBldg is None else _char_distributions(
+                            huBldg, charTypes, char_ids, char_id_sets, char_names)
+                    char_dists = char_dist_cache[key]
+                    if char_dists is None:
                         continue
 
-                    bldgCharId = huBldg['BLDGCHARID'].values.flatten().tolist()
-                    char_desc = []
+                    char_desc = list(char_dists)
+                    char_values = {}
 
                     # Assign building characteristics
-                    for charType in charTypes:
-                        main = huListofBldgChar.loc[
-                            huListofBldgChar['CharType']==charType].copy()
-                        main_list = main['BldgCharID'].values.flatten().tolist()
-                        check = any(item in bldgCharId for item in main_list)
-
-                        if check is True:
-                            char_desc.append(charType)
-                            bldgChar = main['BldgChar'].values.flatten().tolist()
-
-                            probs_df = huBldg[huBldg['BLDGCHARID'].isin(main_list)]
-                            probs_df = probs_df.sort_values(by=['BLDGCHARID'])
-                            probs = [i/100 for i in probs_df['PercentDist'].values.flatten().tolist()]
-
-                            if len(probs) < len(bldgChar):
-                                bldgChar1 = bldgChar[0:len(probs)]
-                            else:
-                                bldgChar1 = bldgChar
-
-                            df3[charType] = pd.NA
-                            np.random.seed(seed)
-                            df3[charType] = df3[charType].apply(
-                                lambda x: np.random.choice(bldgChar1, p=probs))
-                        else:
-                            df3[charType] = pd.NA
-
-                    # Match to wind building type and calculate terrain ID
-                    for row in range(len(df3)):
-                        rows = df3.iloc[row]
-                        wbId_df = huListOfWindBldgTypes.loc[
-                            huListOfWindBldgTypes['sbtName']==sbt]
-                        char_desc1 = char_desc.copy()
-
-                        # Handle shutter characteristic
-                        if "Shutters" in char_desc1:
-                            if rows["Shutters"] == "shtys":
-                                if "Garage, Houses w/out Shutters" in char_desc1:
-                                    char_desc1.remove("Garage, Houses w/out Shutters")
-                            else:
-                                if "Garage, Houses with Shutters" in char_desc1:
-                                    char_desc1.remove("Garage, Houses with Shutters")
-
-                        # Match characteristics to wbID
-                        for char in char_desc1:
-                            sample1 = wbId_df[wbId_df['charDescription'].str.contains(rows[char], na=False)]
-                            if len(sample1) != 0:
-                                wbId_df = sample1
-
-                        wbID = wbId_df['wbID'].values.flatten().tolist()
-
-                        if len(wbID) == 0:
-                            wbID = pd.NA
-                        elif len(wbID) == 1:
-                            wbID = wbID[0]
-                        else:
-                            wbID = wbID[0]  # Take first if multiple matches
-
-                        # Calculate terrain ID from surface roughness
-                        terrain = rows['nsi_val.SURFACEROU']
-                        if terrain <= 0.03:
-                            terrain_ID = 1
-                        elif 0.03 < terrain <= 0.15:
-                            terrain_ID = 2
-                        elif 0.15 < terrain <= 0.35:
-                            terrain_ID = 3
-                        elif 0.35 < terrain <= 0.7:
-                            terrain_ID = 4
-                        else:
-                            terrain_ID = 5
-
-                        # Append result
-                        datas = [str(i) for i in rows]
-                        datas.append(wbID)
-                        datas.append(str(terrain_ID))
-                        building_list.append(datas)
+                    for charType, (bldgChar1, probs) in char_dists.items():
+                        np.random.seed(seed)
+                        char_values[charType] = np.random.choice(bldgChar1, size=len(df3), p=probs)
+                        char_arrs[charType][pos] = char_values[charType]
+
+                    # Match to wind building type. The match depends only on the
+                    # assigned characteristics, so run it once per distinct combination
+                    wbId_df = huListOfWindBldgTypes.loc[huListOfWindBldgTypes['sbtName']==sbt]
+                    if char_desc:
+                        combo_codes, combos = pd.MultiIndex.from_arrays(
+                            [char_values[c] for c in char_desc]).factorize()
+                    else:
+                        combo_codes, combos = np.zeros(len(df3), dtype=np.intp), [()]
+                    combo_wbIDs = pd.array(
+                        [_match_wbID(wbId_df, char_desc, dict(zip(char_desc, combo))) for combo in combos],
+                        dtype='Int64')
+                    wbID_arr[pos] = combo_wbIDs[combo_codes]
+                    order.append(pos)
 
     logger.info(f"  ✓ Processed all {county_count} counties")
 
     # Create final DataFrame
     logger.info(f"\nCreating final building inventory DataFrame...")
-    building_data = pd.DataFrame(building_list)
-    building_data.columns = rows.index.tolist() + ["wbID", "terrainID"]
+    building_data = nsi_cb.assign(sbtName=sbt_arr, **char_arrs, wbID=wbID_arr)
+    building_data['terrainID'] = building_data.pop('terrainID')  # keep as last column
+    building_data = building_data.iloc[np.concatenate(order)].reset_index(drop=True)
     logger.info(f"  ✓ Created DataFrame with {len(building_data):,} buildings")
 
     # Save checkpoint
     logger.info(f"\nSaving checkpoint: {checkpoint_path}")
     building_data.to_csv(checkpoint_path, index=False)
+    _write_inventory_parquet(building_data, checkpoint_path, parquet_path)
     logger.info(f"  ✓ Checkpoint saved successfully")
+    logger.info(f"  Parquet copy: {parquet_path}")
     logger.info(f"  Future runs will load this file instead of recomputing\n")
 
     logger.info(f"{'='*70}")
@@ -371,7 +352,241 @@ def characterize_buildings(nsi_data, hazus_dir, output_dir, force_rerun=False):
     return building_data
 
 
-def calculate_building_losses(building_inventory, joined_data_paths, hazus_dir, output_dir, force_rerun=False):
+def _county_fips(block_fips):
+    """
+    County FIPS codes (first 5 of the 15 digits) of census block FIPS codes.
+
+    Numeric codes are divided by 10**10, which is also correct for codes whose
+    leading zero was lost when parsed as numbers; text codes are sliced.
+
+    Parameters:
+    -----------
+    block_fips : Series
+        Census block FIPS codes (cbfips)
+
+    Returns:
+    --------
+    Series
+        County FIPS codes, numeric or text like the input
+    """
+    if pd.api.types.is_numeric_dtype(block_fips):
+        return block_fips // 10**10
+    return block_fips.astype('string').str.slice(0, 5)
+
+
+def _read_mapping_sheet(mapping_file, sheet_name, cache_dir, force_rerun=False):
+    """
+    Read one sheet of the Hazus mapping workbook through a Parquet cache.
+
+    Parsing the workbook with openpyxl is slow, so each sheet is cached as
+    {cache_dir}/Mapping.{sheet_name}.parquet. The cache is reused only while
+    the workbook's path, size and mtime match the ones stored with it.
+
+    Parameters:
+    -----------
+    mapping_file : str
+        Path to the Hazus mapping workbook (Mapping.xlsx)
+    sheet_name : str
+        Sheet to read
+    cache_dir : str
+        Directory for the cached sheet
+    force_rerun : bool, optional
+        If True, re-read the workbook even if the cache is valid. Default is False.
+
+    Returns:
+    --------
+    DataFrame
+        Sheet contents
+    """
+    workbook = os.path.splitext(os.path.basename(mapping_file))[0]
+    cache_path = os.path.join(cache_dir, f"{workbook}.{sheet_name}.parquet")
+
+    source = source_stamp(mapping_file)
+    if not force_rerun and cached_source(cache_path) == source:
+        return pd.read_parquet(cache_path)
+
+    sheet = pd.read_excel(mapping_file, sheet_name=sheet_name)
+    sheet.attrs['source'] = source
+    try:
+        sheet.to_parquet(cache_path, index=False)
+    except (TypeError, ValueError, OSError) as e:
+        # e.g. a column mixing numbers and text; the sheet is simply re-read next time
+        logger.warning(f"  ⚠ Could not cache sheet {sheet_name}: {e}")
+    return sheet
+
+
+def _char_distributions(huBldg, charTypes, char_ids, char_id_sets, char_names):
+    """
+    Derive the characteristic distributions of one (scheme, subtype) pair.
+
+    Parameters:
+    -----------
+    huBldg : DataFrame
+        huBldgMapping rows for the scheme and subtype
+    charTypes : list of str
+        Characteristic types, in assignment order
+    char_ids, char_id_sets, char_names : dict
+        BldgCharID array, set and BldgChar names per characteristic type
+
+    Returns:
+    --------
+    dict
+        (bldgChar1, probs) per characteristic type present for the subtype,
+        in charTypes order
+    """
+    bldgCharId = huBldg['BLDGCHARID'].to_numpy()
+    bldgCharIdSet = set(bldgCharId.tolist())
+    char_dists = {}
+
+    for charType in charTypes:
+        if not bldgCharIdSet.isdisjoint(char_id_sets[charType]):
+            bldgChar = char_names[charType]
+
+            probs_df = huBldg[np.isin(bldgCharId, char_ids[charType])]
+            probs_df = probs_df.sort_values(by=['BLDGCHARID'])
+            probs = [i/100 for i in probs_df['PercentDist'].values.flatten().tolist()]
+
+            if len(probs) < len(bldgChar):
+                bldgChar1 = bldgChar[0:len(probs)]
+            else:
+                bldgChar1 = bldgChar
+
+            char_dists[charType] = (bldgChar1, probs)
+
+    return char_dists
+
+
+def _match_wbID(wbId_df, char_desc, chars):
+    """
+    Match a building's assigned characteristics to a Hazus wind building type.
+
+    Parameters:
+    -----------
+    wbId_df : DataFrame
+        huListOfWindBldgTypes rows for the building's subtype
+    char_desc : list of str
+        Characteristic types assigned for the subtype
+    chars : dict
+        Assigned value of each characteristic type in char_desc
+
+    Returns:
+    --------
+    int or pd.NA
+        First matching wbID, or pd.NA if the subtype has no wind building types
+    """
+    char_desc1 = char_desc.copy()
+
+    # Handle shutter characteristic
+    if "Shutters" in char_desc1:
+        if chars["Shutters"] == "shtys":
+            if "Garage, Houses w/out Shutters" in char_desc1:
+                char_desc1.remove("Garage, Houses w/out Shutters")
+        else:
+            if "Garage, Houses with Shutters" in char_desc1:
+                char_desc1.remove("Garage, Houses with Shutters")
+
+    # Narrow the candidates by each characteristic that still matches
+    for char in char_desc1:
+        sample1 = wbId_df[wbId_df['charDescription'].str.contains(chars[char], na=False)]
+        if len(sample1) != 0:
+            wbId_df = sample1
+
+    wbID = wbId_df['wbID'].tolist()
+
+    if len(wbID) == 0:
+        return pd.NA
+    return wbID[0]  # Take first if multiple matches
+
+
+def load_building_inventory(checkpoint_path):
+    """
+    Load a building characterization checkpoint.
+
+    If a Parquet file with the same name sits next to the CSV checkpoint
+    (e.g., nsi_wbId_sr.parquet beside nsi_wbId_sr.csv) and was written from
+    the current CSV, it is read instead, since it loads much faster than
+    re-parsing the CSV (see resolve_inventory_path).
+
+    Parameters:
+    -----------
+    checkpoint_path : str
+        Path to the checkpoint CSV (nsi_wbId_sr.csv)
+
+    Returns:
+    --------
+    DataFrame
+        Building inventory with wbID and terrainID columns
+    """
+    return _read_inventory(resolve_inventory_path(checkpoint_path))
+
+
+def resolve_inventory_path(checkpoint_path):
+    """
+    Return the file load_building_inventory reads for a checkpoint path.
+
+    Parameters:
+    -----------
+    checkpoint_path : str
+        Path to the checkpoint CSV (nsi_wbId_sr.csv)
+
+    Returns:
+    --------
+    str
+        The Parquet copy beside it if it was written from the current CSV
+        (matching source stamp) or the CSV does not exist; otherwise
+        checkpoint_path
+    """
+    parquet_path = os.path.splitext(checkpoint_path)[0] + '.parquet'
+    if not os.path.exists(parquet_path):
+        return checkpoint_path
+    if not os.path.exists(checkpoint_path):
+        return parquet_path
+    if cached_source(parquet_path) == source_stamp(checkpoint_path):
+        return parquet_path
+    logger.warning(f"  ⚠ Parquet copy {parquet_path} does not match {checkpoint_path}; reading the CSV")
+    return checkpoint_path
+
+
+def _read_inventory(inventory_path):
+    """
+    Read a building inventory from its CSV checkpoint or Parquet copy.
+
+    Parameters:
+    -----------
+    inventory_path : str
+        File returned by resolve_inventory_path
+
+    Returns:
+    --------
+    DataFrame
+        Building inventory with wbID and terrainID columns
+    """
+    if inventory_path.endswith('.parquet'):
+        logger.info(f"  Reading Parquet copy: {inventory_path}")
+        return pd.read_parquet(inventory_path, dtype_backend='pyarrow')
+    return pd.read_csv(inventory_path, engine='pyarrow', dtype_backend='pyarrow')
+
+
+def _write_inventory_parquet(building_data, checkpoint_path, parquet_path):
+    """
+    Write the Parquet copy of a checkpoint, stamped with the CSV it mirrors.
+
+    Parameters:
+    -----------
+    building_data : DataFrame
+        Building inventory, as saved to checkpoint_path
+    checkpoint_path : str
+        Path to the checkpoint CSV
+    parquet_path : str
+        Path of the Parquet copy to write
+    """
+    building_data.attrs['source'] = source_stamp(checkpoint_path)
+    building_data.to_parquet(parquet_path, index=False,
+                             compression='zstd', use_dictionary=True)
+
+
+def calculate_building_losses(building_inventory, joined_data_paths, hazus_dir, output_dir, force_rerun=False,
+                              executor=None):
     """
     Calculate individual building losses for each climate scenario.
 
@@ -391,6 +606,9 @@ def calculate_building_losses(building_inventory, joined_data_paths, hazus_dir,
         Directory for loss calculation outputs
     force_rerun : bool, optional
         If True, recalculate even if output files exist. Default is False.
+    executor : concurrent.futures.Executor, optional
+        If given, scenarios are calculated in parallel on this executor.
+        Default is None (calculate scenarios sequentially in this process).
 
     Returns:
     --------
@@ -405,18 +623,20 @@ def calculate_building_losses(building_inventory, joined_data_paths, hazus_dir,
 
     Processing Steps:
     -----------------
-    For each scenario (1971, 2021, 2071):
+    Damage functions are arranged once into curve arrays keyed by
+    (wbID, terrainID), and each building's curves are looked up once from
+    its wbID and terrainID:
+       - Building damage function (DamLossDescID=5)
+       - Contents damage function (DamLossDescID=6)
+    Then, for each scenario (1971, 2021, 2071):
     1. Load joined building data with wind speeds
-    2. Merge with building inventory (wbID, terrainID)
-    3. For each building:
-       a. Look up damage functions by wbID and terrainID
-       b. Building damage function (DamLossDescID=5)
-       c. Contents damage function (DamLossDescID=6)
-       d. Interpolate loss ratio from wind speed
-       e. Calculate dollar losses:
+    2. Merge with building inventory (wbID, terrainID) on fd_id
+    3. For all buildings at once:
+       a. Interpolate loss ratio from wind speed
+       b. Calculate dollar losses:
           - building_loss = loss_ratio × building_value
           - contents_loss = loss_ratio × contents_value
-    4. Save individual building losses to CSV
+    4. Save individual building losses to CSV (plus a Parquet copy)
 
     Output Format:
     --------------
@@ -456,15 +676,17 @@ def calculate_building_losses(building_inventory, joined_data_paths, hazus_dir,
 
     logger.info(f"Loading Hazus damage functions: {damage_func_file}")
     huDamLossFunc = pd.read_csv(damage_func_file)
-    logger.info(f"  ✓ Loaded damage functions")
+    damage_curves = _damage_curves(huDamLossFunc)
+    logger.info(f"  ✓ Loaded {damage_curves['available'].sum():,} damage function pairs")
 
-    damLossDescID = [config.BUILDING_DAMAGE_ID, config.CONTENTS_DAMAGE_ID]
+    # The curve lookup depends only on the inventory, so it is shared by all scenarios
+    inventory = _curve_inventory(building_inventory, damage_curves)
+    logger.info(f"  Buildings with damage functions: {len(inventory):,}")
 
     loss_files = {}
+    pending = {}
 
     for scenario, joined_csv in joined_data_paths.items():
-        logger.info(f"\nCalculating losses for scenario: {scenario}")
-
         # Create scenario output directory
         scenario_output_dir = os.path.join(output_dir, scenario)
         os.makedirs(scenario_output_dir, exist_ok=True)
@@ -473,103 +695,262 @@ def calculate_building_losses(building_inventory, joined_data_paths, hazus_dir,
 
         # Skip if already exists
         if os.path.exists(output_csv) and not force_rerun:
+            logger.info(f"\nScenario: {scenario}")
             logger.info(f"  Output already exists: {output_csv}")
             logger.info(f"  Skipping calculation (use --force-rerun to recalculate)")
             loss_files[scenario] = output_csv
             continue
 
-        try:
-            # Load joined data
-            logger.info(f"  Loading joined data...")
-            nsi_wrf = pd.read_csv(joined_csv)
-            logger.info(f"    ✓ Loaded {len(nsi_wrf):,} building records")
+        # One worker per scenario when an executor is given
+        if executor is None:
+            loss_files[scenario] = _run_scenario(
+                scenario, inventory, joined_csv, damage_curves, output_csv)
+        else:
+            pending[scenario] = executor.submit(
+                _run_scenario, scenario, inventory, joined_csv, damage_curves, output_csv)
 
-            losses = []
-            buildings_processed = 0
+    for scenario, future in pending.items():
+        loss_files[scenario] = future.result()
 
-            logger.info(f"  Processing building losses...")
+    # Keep the caller's scenario order regardless of which outputs were skipped
+    loss_files = {s: loss_files[s] for s in joined_data_paths}
 
-            for id in range(0, len(building_inventory)):
-                row = building_inventory.iloc[id]
-                row1 = row.dropna()
-                fdid = row1.iloc[1]
-                cbfip = row1.iloc[3]
+    logger.info(f"\n{'='*70}")
+    logger.info(f"Step 3B Complete: Individual Building Losses")
+    logger.info(f"{'='*70}\n")
 
-                wbID = int(row1.iloc[-2])
-                terrain_ID = int(row1.iloc[-1])
+    return loss_files
 
-                # Get wind speed for this building
-                wind_df = nsi_wrf.loc[nsi_wrf['fd_id'] == fdid]
-                if len(wind_df) == 0:
-                    continue
 
-                wind_speed = wind_df['Gust_Wind_Speed'].iloc[0]
-
-                # Look up damage functions
-                bldgLossFunc = huDamLossFunc.loc[
-                    (huDamLossFunc['wbID']==wbID) &
-                    (huDamLossFunc['TERRAINID']==terrain_ID) &
-                    (huDamLossFunc['DamLossDescID']==damLossDescID[0])
-                ]
-                contLossFunc = huDamLossFunc.loc[
-                    (huDamLossFunc['wbID']==wbID) &
-                    (huDamLossFunc['TERRAINID']==terrain_ID) &
-                    (huDamLossFunc['DamLossDescID']==damLossDescID[1])
-                ]
-
-                if len(bldgLossFunc) == 0 or len(contLossFunc) == 0:
-                    continue
+def _damage_curves(huDamLossFunc):
+    """
+    Arrange the Hazus damage functions as a dense curve array for O(1) lookup.
 
-                bldgLossFunc = bldgLossFunc.drop(['wbID','TERRAINID','DamLossDescID'], axis=1)
-                contLossFunc = contLossFunc.drop(['wbID','TERRAINID','DamLossDescID'], axis=1)
+    Parameters:
+    -----------
+    huDamLossFunc : DataFrame
+        Hazus damage functions (huDamLossFunc.csv)
 
-                val_struct = row1.iloc[12]
-                val_cont = row1.iloc[13]
-                values_str = bldgLossFunc.values.flatten().tolist()
-                values_cont = contLossFunc.values.flatten().tolist()
-                wind_speeds = [int(i[2:]) for i in bldgLossFunc.columns]
+    Returns:
+    --------
+    dict
+        - wbIDs : sorted ndarray of wind building type IDs (curve axis 0)
+        - terrainIDs : sorted ndarray of terrain IDs (curve axis 1)
+        - wind_speeds : ndarray of curve wind speeds (mph), from the WS* columns
+        - curves : ndarray (n_wbIDs, n_terrainIDs, 2, n_speeds) of loss ratios;
+          axis 2 holds the building (DamLossDescID=5) then contents (6) curve
+        - available : bool ndarray (n_wbIDs, n_terrainIDs), True where the
+          table has both curves
+    """
+    key_cols = ['wbID', 'TERRAINID', 'DamLossDescID']
+    speed_cols = [c for c in huDamLossFunc.columns if c not in key_cols]
+    damLossDescIDs = [config.BUILDING_DAMAGE_ID, config.CONTENTS_DAMAGE_ID]
 
-                # Interpolate loss ratios
-                building_loss = np.interp(wind_speed, wind_speeds, values_str) * val_struct
-                contents_loss = np.interp(wind_speed, wind_speeds, values_cont) * val_cont
+    # First row per (wbID, terrain, function) when the table has duplicates
+    func = huDamLossFunc.loc[huDamLossFunc['DamLossDescID'].isin(damLossDescIDs)]
+    func = func.drop_duplicates(key_cols)
 
-                losses.append([fdid, cbfip, wbID, terrain_ID, wind_speed,
-                              building_loss, contents_loss])
+    wbIDs = np.unique(func['wbID'].to_numpy())
+    terrainIDs = np.unique(func['TERRAINID'].to_numpy())
+    wi = np.searchsorted(wbIDs, func['wbID'].to_numpy())
+    ti = np.searchsorted(terrainIDs, func['TERRAINID'].to_numpy())
+    di = (func['DamLossDescID'].to_numpy() == config.CONTENTS_DAMAGE_ID).astype(np.intp)
 
-                buildings_processed += 1
+    curves = np.full((len(wbIDs), len(terrainIDs), len(damLossDescIDs), len(speed_cols)), np.nan)
+    curves[wi, ti, di] = func[speed_cols].to_numpy(dtype=float)
+    has_func = np.zeros(curves.shape[:3], dtype=bool)
+    has_func[wi, ti, di] = True
 
-                if buildings_processed % 10000 == 0:
-                    logger.info(f"    Processed {buildings_processed:,} buildings...")
+    return {
+        'wbIDs': wbIDs,
+        'terrainIDs': terrainIDs,
+        'wind_speeds': np.array([int(c[2:]) for c in speed_cols], dtype=float),
+        'curves': curves,
+        'available': has_func.all(axis=2)
+    }
 
-            logger.info(f"    ✓ Processed {buildings_processed:,} buildings total")
 
-            # Create losses DataFrame
-            wind_losses = pd.DataFrame(losses)
-            wind_losses.columns = ['fd_id', 'countyFIPS', 'wbID', 'terrainID',
-                                   'Wind_Speed', 'Building_Loss', 'Contents_Loss']
+def _key_index(keys, values):
+    """Position of each value in the sorted array keys, and whether it is present."""
+    idx = np.searchsorted(keys, values).clip(max=len(keys) - 1)
+    return idx, keys[idx] == values
 
-            # Log statistics
-            logger.info(f"  Loss statistics:")
-            logger.info(f"    Total building loss: ${wind_losses['Building_Loss'].sum():,.2f}")
-            logger.info(f"    Total contents loss: ${wind_losses['Contents_Loss'].sum():,.2f}")
-            logger.info(f"    Total loss: ${(wind_losses['Building_Loss'].sum() + wind_losses['Contents_Loss'].sum()):,.2f}")
 
-            # Save to CSV
-            logger.info(f"  Saving losses: {output_csv}")
-            wind_losses.to_csv(output_csv, index=False)
-            logger.info(f"  ✓ Successfully calculated losses for {scenario}")
+def _interp_losses(wind_speed, val_struct, val_cont, curve_idx, damage_curves):
+    """
+    Interpolate building and contents losses for every building at once.
 
-            loss_files[scenario] = output_csv
+    Each building's loss ratio is np.interp(wind_speed[i], wind_speeds, curve)
+    on its (wbID, terrainID) curve (clamped to the end points outside the
+    curve's wind speeds), times its replacement value. All curves share the same wind
+    speeds, so the bracketing interval is located once and reused for both
+    the building and the contents curve.
 
-        except Exception as e:
-            logger.error(f"  ✗ Error calculating losses for {scenario}: {str(e)}")
-            raise
+    Parameters:
+    -----------
+    wind_speed, val_struct, val_cont : ndarray
+        Per-building gust wind speed (mph) and replacement values ($)
+    curve_idx : ndarray
+        Per-building flat (wbID, terrainID) index into the damage curve array
+    damage_curves : dict
+        Hazus damage curves (from _damage_curves)
 
-    logger.info(f"\n{'='*70}")
-    logger.info(f"Step 3B Complete: Individual Building Losses")
-    logger.info(f"{'='*70}\n")
+    Returns:
+    --------
+    tuple of ndarray
+        (building_loss, contents_loss)
+    """
+    xp = damage_curves['wind_speeds']
+    j = np.clip(np.searchsorted(xp, wind_speed, side='right') - 1, 0, len(xp) - 2)
+    x0 = xp[j]
+    dx = wind_speed - x0
+    width = xp[j + 1] - x0
+    at_x0 = dx == 0
+    below = wind_speed < xp[0]
+    above = wind_speed >= xp[-1]
+
+    # (wbID, terrainID) pairs flattened to match curve_idx
+    curves = damage_curves['curves']
+    curves = curves.reshape(-1, *curves.shape[2:])
+
+    losses = []
+    for d, value in enumerate((val_struct, val_cont)):
+        y0 = curves[curve_idx, d, j]
+        y1 = curves[curve_idx, d, j + 1]
+        ratio = np.where(at_x0, y0, (y1 - y0) / width * dx + y0)
+        ratio = np.where(below, curves[curve_idx, d, 0], ratio)
+        ratio = np.where(above, curves[curve_idx, d, -1], ratio)
+        losses.append(ratio * value)
+
+    return tuple(losses)
+
+
+def _curve_inventory(building_inventory, damage_curves):
+    """
+    Select the buildings that have damage curves and attach their curve row.
+
+    Parameters:
+    -----------
+    building_inventory : DataFrame
+        Building data with wbID and terrainID (from characterize_buildings)
+    damage_curves : dict
+        Hazus damage curves (from _damage_curves)
+
+    Returns:
+    --------
+    DataFrame
+        fd_id, cbfips, wbID, terrainID and curve_idx (flat index into the
+        curve array) for each building with a wbID and a matching damage function pair,
+        in inventory order
+    """
+    fd_id = config.NSI_COLUMNS['foundation_id']
+    cbfips = config.NSI_COLUMNS['county_fips']
+
+    # Buildings without a wind building type have no damage function
+    inventory = building_inventory.loc[building_inventory['wbID'].notna(),
+                                       [fd_id, cbfips, 'wbID', 'terrainID']]
+    inventory = inventory.astype({'wbID': 'int64', 'terrainID': 'int64'})
+
+    # Look up each building's damage curves; drop pairs without one
+    wi, wb_found = _key_index(damage_curves['wbIDs'], inventory['wbID'].to_numpy())
+    ti, terrain_found = _key_index(damage_curves['terrainIDs'], inventory['terrainID'].to_numpy())
+    has_curve = wb_found & terrain_found
+    has_curve[has_curve] = damage_curves['available'][wi[has_curve], ti[has_curve]]
+    curve_idx = np.ravel_multi_index((wi[has_curve], ti[has_curve]),
+                                     damage_curves['available'].shape)
+    return inventory.loc[has_curve].assign(curve_idx=curve_idx)
 
-    return loss_files
+
+def _run_scenario(scenario, inventory, joined_csv, damage_curves, output_csv):
+    """
+    Calculate individual building losses for a single scenario.
+
+    Runs either in-process or in a worker process (see calculate_building_losses).
+
+    Parameters:
+    -----------
+    scenario : str
+        Scenario name (e.g., 'ida_2021')
+    inventory : DataFrame
+        Buildings with their damage curve rows (from _curve_inventory)
+    joined_csv : str
+        Path to the scenario's joined building/wind CSV (gust wind speed and
+        replacement values per building)
+    damage_curves : dict
+        Hazus damage curves (from _damage_curves)
+    output_csv : str
+        Path of the loss CSV file to write
+
+    Returns:
+    --------
+    str
+        Path to the written CSV file
+    """
+    logger.info(f"\nCalculating losses for scenario: {scenario}")
+
+    fd_id = config.NSI_COLUMNS['foundation_id']
+    cbfips = config.NSI_COLUMNS['county_fips']
+    val_struct = config.NSI_COLUMNS['structure_value']
+    val_cont = config.NSI_COLUMNS['contents_value']
+
+    try:
+        # Load joined data (only the columns used here, with fixed dtypes)
+        logger.info(f"  Loading joined data...")
+        nsi_wrf = pd.read_csv(
+            joined_csv, engine='pyarrow',
+            usecols=[fd_id, 'Gust_Wind_Speed', val_struct, val_cont],
+            dtype={fd_id: 'int64', 'Gust_Wind_Speed': 'float64',
+                   val_struct: 'float64', val_cont: 'float64'})
+        logger.info(f"    ✓ Loaded {len(nsi_wrf):,} building records")
+
+        logger.info(f"  Processing building losses...")
+
+        # Attach each building's wind speed and replacement values (first
+        # joined record per building), keeping the inventory order
+        wind = nsi_wrf.drop_duplicates(fd_id)
+        buildings = inventory.merge(wind, on=fd_id, how='inner')
+
+        # Interpolate loss ratios and apply replacement values
+        wind_speed = buildings['Gust_Wind_Speed'].to_numpy(dtype=float)
+        building_loss, contents_loss = _interp_losses(
+            wind_speed,
+            buildings[val_struct].to_numpy(dtype=float),
+            buildings[val_cont].to_numpy(dtype=float),
+            buildings['curve_idx'].to_numpy(),
+            damage_curves
+        )
+
+        wind_losses = pd.DataFrame({
+            'fd_id': buildings[fd_id].to_numpy(),
+            'countyFIPS': buildings[cbfips].to_numpy(),
+            'wbID': buildings['wbID'].to_numpy(),
+            'terrainID': buildings['terrainID'].to_numpy(),
+            'Wind_Speed': wind_speed,
+            'Building_Loss': building_loss,
+            'Contents_Loss': contents_loss
+        })
+
+        logger.info(f"    ✓ Processed {len(wind_losses):,} buildings total")
+
+        # Log statistics
+        logger.info(f"  Loss statistics:")
+        logger.info(f"    Total building loss: ${wind_losses['Building_Loss'].sum():,.2f}")
+        logger.info(f"    Total contents loss: ${wind_losses['Contents_Loss'].sum():,.2f}")
+        logger.info(f"    Total loss: ${(wind_losses['Building_Loss'].sum() + wind_losses['Contents_Loss'].sum()):,.2f}")
+
+        # Save to CSV, plus a typed Parquet copy for the aggregation step
+        logger.info(f"  Saving losses: {output_csv}")
+        wind_losses.to_csv(output_csv, index=False)
+        wind_losses.to_parquet(
+            os.path.join(os.path.dirname(output_csv), config.BUILDING_LOSSES_PARQUET),
+            index=False, compression='zstd')
+        logger.info(f"  ✓ Successfully calculated losses for {scenario}")
+
+        return output_csv
+
+    except Exception as e:
+        logger.error(f"  ✗ Error calculating losses for {scenario}: {str(e)}")
+        raise
 
 
 def aggregate_county_losses(loss_data_paths, output_dir, force_rerun=False):
@@ -602,7 +983,7 @@ def aggregate_county_losses(loss_data_paths, output_dir, force_rerun=False):
     Processing Steps:
     -----------------
     1. For each scenario:
-       a. Load individual building losses
+       a. Load individual building losses (Parquet copy if present)
        b. Extract county FIPS (first 5 digits)
        c. Sum building and contents losses by county
        d. Calculate total loss per scenario
@@ -661,30 +1042,35 @@ def aggregate_county_losses(loss_data_paths, output_dir, force_rerun=False):
             logger.error(f"  ✗ Loss file not found: {losses_csv}")
             raise FileNotFoundError(f"Loss file not found: {losses_csv}")
 
-        # Load individual building losses
-        logger.info(f"  Loading: {losses_csv}")
-        df_indiv = pd.read_csv(losses_csv)
+        # Load individual building losses (Parquet copy when available)
+        losses_parquet = os.path.join(os.path.dirname(losses_csv), config.BUILDING_LOSSES_PARQUET)
+        if os.path.exists(losses_parquet):
+            logger.info(f"  Loading: {losses_parquet}")
+            df_indiv = pd.read_parquet(losses_parquet)
+        else:
+            logger.info(f"  Loading: {losses_csv}")
+            df_indiv = pd.read_csv(
+                losses_csv, engine='pyarrow',
+                usecols=['countyFIPS', 'Building_Loss', 'Contents_Loss'],
+                dtype={'countyFIPS': 'Int64', 'Building_Loss': 'float64',
+                       'Contents_Loss': 'float64'})
         logger.info(f"    ✓ Loaded {len(df_indiv):,} building records")
 
         # Extract county FIPS
-        df_indiv['UcountyFIPS'] = df_indiv['countyFIPS'].astype(str).str[:5]
-        cfips = [str(io) for io in df_indiv['UcountyFIPS'].unique()]
-        logger.info(f"    Counties: {len(cfips)}")
-
-        # Aggregate by county
-        losses_county = []
-        for cfip in cfips:
-            df = df_indiv.loc[df_indiv['UcountyFIPS']==cfip].copy()
-            bldg_loss = sum(df['Building_Loss'])
-            cnt_loss = sum(df['Contents_Loss'])
-            losses_county.append([cfip, bldg_loss, cnt_loss])
+        df_indiv['UcountyFIPS'] = _county_fips(df_indiv['countyFIPS'])
 
-        df_county_losses = pd.DataFrame(losses_county)
-        df_county_losses.columns = ['cfips', 'Building_Loss', 'Contents_Loss']
+        # Aggregate by county (single hashed groupby pass)
+        df_county_losses = (
+            df_indiv.groupby('UcountyFIPS', sort=False)[['Building_Loss', 'Contents_Loss']]
+            .sum()
+            .rename_axis('cfips')
+            .reset_index()
+        )
+        logger.info(f"    Counties: {len(df_county_losses)}")
 
         # Calculate totals
-        total_bldg = round(sum(df_county_losses['Building_Loss']), 0)
-        total_cont = round(sum(df_county_losses['Contents_Loss']), 0)
+        total_bldg = round(df_county_losses['Building_Loss'].sum(), 0)
+        total_cont = round(df_county_losses['Contents_Loss'].sum(), 0)
         total_all = total_bldg + total_cont
 
         logger.info(f"  Total losses for {scenario}:")
@@ -11,14 +11,17 @@ process_ncar_netcdf : Main function to process all NetCDF files to CSV format
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import netCDF4
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import config
 
 logger = logging.getLogger(__name__)
 
 
-def process_ncar_netcdf(ncar_dir, output_dir, force_rerun=False):
+def process_ncar_netcdf(ncar_dir, output_dir, force_rerun=False, executor=None):
     """
     Process NCAR NetCDF climate model output to CSV format.
 
@@ -34,6 +37,9 @@ def process_ncar_netcdf(ncar_dir, output_dir, force_rerun=False):
         Directory for processed CSV outputs
     force_rerun : bool, optional
         If True, reprocess even if output files exist. Default is False.
+    executor : concurrent.futures.Executor, optional
+        If given, scenarios are processed in parallel on this executor.
+        Default is None (process scenarios sequentially in this process).
 
     Returns:
     --------
@@ -107,8 +113,10 @@ def process_ncar_netcdf(ncar_dir, output_dir, force_rerun=False):
         logger.error(error_msg)
         raise FileNotFoundError(error_msg)
 
-    # Process each NetCDF file
+    # Process each NetCDF file (one worker per scenario when an executor is given)
     output_files = {}
+    pending = {}
+    sequential = []
 
     for netcdf_file in config.NETCDF_FILES:
         # Extract scenario name (e.g., 'ida_1971' from 'ida_1971.nc')
@@ -123,86 +131,213 @@ def process_ncar_netcdf(ncar_dir, output_dir, force_rerun=False):
             output_files[scenario] = output_csv
             continue
 
-        logger.info(f"\nProcessing scenario: {scenario}")
-        logger.info(f"  Input: {netcdf_file}")
-
-        try:
-            # Open NetCDF file
-            netcdf_path = os.path.join(ncar_dir, netcdf_file)
-            nc = netCDF4.Dataset(netcdf_path, 'r')
-
-            # Validate required variables exist
-            required_vars = config.NETCDF_VARIABLES
-            missing_vars = []
-            for var_name, var_key in required_vars.items():
-                if var_key not in nc.variables:
-                    missing_vars.append(var_key)
-
-            if missing_vars:
-                nc.close()
-                error_msg = f"NetCDF file {netcdf_file} missing variables: {', '.join(missing_vars)}"
-                logger.error(f"  ✗ {error_msg}")
-                raise KeyError(error_msg)
-
-            # Extract 2D arrays
-            logger.info(f"  Extracting wind swath data...")
-            swath_wind = nc[required_vars['wind']][:]
-            lon_2d = nc[required_vars['longitude']][:]
-            lat_2d = nc[required_vars['latitude']][:]
-
-            # Log array dimensions
-            logger.info(f"    Wind array shape: {swath_wind.shape}")
-            logger.info(f"    Longitude array shape: {lon_2d.shape}")
-            logger.info(f"    Latitude array shape: {lat_2d.shape}")
-
-            # Close NetCDF file
-            nc.close()
-
-            # Flatten arrays to 1D
-            logger.info(f"  Flattening 2D arrays to 1D...")
-            longitude = lon_2d.flatten()
-            latitude = lat_2d.flatten()
-            wind_speed = swath_wind.flatten()
-
-            # Calculate gust wind speed
-            # gust = sustained_wind × gust_factor × unit_conversion
-            logger.info(f"  Calculating gust wind speeds...")
-            logger.info(f"    Gust factor: {config.GUST_FACTOR_NCAR}")
-            logger.info(f"    Unit conversion (m/s to mph): {config.MS_TO_MPH}")
-            gust_wind_speed = wind_speed * config.GUST_FACTOR_NCAR * config.MS_TO_MPH
-
-            # Adjust longitude from [0,360] to [-180,180]
-            logger.info(f"  Adjusting longitude coordinates...")
-            longitude_adjusted = longitude + config.LONGITUDE_ADJUSTMENT
-
-            # Create DataFrame
-            df = pd.DataFrame({
-                'Longitude': longitude_adjusted,
-                'Latitude': latitude,
-                'Wind_Speed': wind_speed,
-                'Gust_Wind_Speed': gust_wind_speed
-            })
-
-            # Log statistics
-            logger.info(f"  Data statistics:")
-            logger.info(f"    Total grid points: {len(df):,}")
-            logger.info(f"    Max gust wind speed: {df['Gust_Wind_Speed'].max():.2f} mph")
-            logger.info(f"    Longitude range: [{df['Longitude'].min():.2f}, {df['Longitude'].max():.2f}]")
-            logger.info(f"    Latitude range: [{df['Latitude'].min():.2f}, {df['Latitude'].max():.2f}]")
-
-            # Save to CSV
-            logger.info(f"  Saving to: {output_csv}")
-            df.to_csv(output_csv, index=False)
-            logger.info(f"  ✓ Successfully processed {scenario}")
-
-            output_files[scenario] = output_csv
-
-        except Exception as e:
-            logger.error(f"  ✗ Error processing {netcdf_file}: {str(e)}")
-            raise
+        netcdf_path = os.path.join(ncar_dir, netcdf_file)
+        if executor is None:
+            sequential.append((scenario, netcdf_path, output_csv))
+        else:
+            pending[scenario] = executor.submit(_run_scenario, scenario, netcdf_path, output_csv)
+
+    # Without an executor, a reader thread loads the next file's variables while
+    # the current scenario is converted and written (netCDF4 releases the GIL
+    # during reads, and only the reader thread touches the files)
+    if sequential:
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            prefetched = reader.submit(_read_netcdf, sequential[0][1])
+            for i, (scenario, netcdf_path, output_csv) in enumerate(sequential):
+                current = prefetched
+                if i + 1 < len(sequential):
+                    prefetched = reader.submit(_read_netcdf, sequential[i + 1][1])
+                output_files[scenario] = _run_scenario(scenario, netcdf_path, output_csv, current)
+
+    for scenario, future in pending.items():
+        output_files[scenario] = future.result()
+
+    # Keep scenario order stable regardless of which outputs were skipped
+    output_files = {s: output_files[s] for s in config.SCENARIOS if s in output_files}
 
     logger.info(f"\n{'='*70}")
     logger.info(f"Step 1 Complete: Processed {len(output_files)} scenarios")
     logger.info(f"{'='*70}\n")
 
     return output_files
+
+
+def _run_scenario(scenario, netcdf_path, output_csv, prefetched=None):
+    """
+    Convert a single scenario's NetCDF wind swath to CSV.
+
+    Runs either in-process or in a worker process (see process_ncar_netcdf).
+
+    Parameters:
+    -----------
+    scenario : str
+        Scenario name (e.g., 'ida_2021')
+    netcdf_path : str
+        Path to the scenario's NetCDF file
+    output_csv : str
+        Path of the CSV file to write
+    prefetched : concurrent.futures.Future, optional
+        Pending _read_netcdf(netcdf_path) result. Default is None (read here).
+
+    Returns:
+    --------
+    str
+        Path to the written CSV file
+    """
+    netcdf_file = os.path.basename(netcdf_path)
+
+    logger.info(f"\nProcessing scenario: {scenario}")
+    logger.info(f"  Input: {netcdf_file}")
+
+    try:
+        # Extract 2D arrays
+        logger.info(f"  Extracting wind swath data...")
+        if prefetched is None:
+            swath_wind, lon_2d, lat_2d = _read_netcdf(netcdf_path)
+        else:
+            swath_wind, lon_2d, lat_2d = prefetched.result()
+
+        # Log array dimensions
+        logger.info(f"    Wind array shape: {swath_wind.shape}")
+        logger.info(f"    Longitude array shape: {lon_2d.shape}")
+        logger.info(f"    Latitude array shape: {lat_2d.shape}")
+
+        # Flatten arrays to 1D (views of the C-contiguous reads, nothing is copied).
+        # Derived columns are computed in float64, as masked-array arithmetic did
+        logger.info(f"  Flattening 2D arrays to 1D...")
+        longitude = lon_2d.ravel()
+        latitude = lat_2d.ravel()
+        wind_speed = swath_wind.ravel()
+
+        # Calculate gust wind speed
+        # gust = sustained_wind × gust_factor × unit_conversion
+        logger.info(f"  Calculating gust wind speeds...")
+        logger.info(f"    Gust factor: {config.GUST_FACTOR_NCAR}")
+        logger.info(f"    Unit conversion (m/s to mph): {config.MS_TO_MPH}")
+        # Scaled into a single float64 buffer (no temporaries). The float32 ->
+        # float64 cast happens inside the first ufunc's buffered loop rather
+        # than as a separate pass; the two factors are applied in turn so
+        # results match the unfused expression
+        gust_wind_speed = np.empty(wind_speed.shape, dtype=np.float64)
+        np.multiply(wind_speed, config.GUST_FACTOR_NCAR, out=gust_wind_speed, dtype=np.float64)
+        np.multiply(gust_wind_speed, config.MS_TO_MPH, out=gust_wind_speed)
+
+        # Adjust longitude from [0,360] to [-180,180]
+        logger.info(f"  Adjusting longitude coordinates...")
+        longitude_adjusted = np.empty(longitude.shape, dtype=np.float64)
+        np.add(longitude, config.LONGITUDE_ADJUSTMENT, out=longitude_adjusted, dtype=np.float64)
+
+        # Log statistics (NaN-aware, like the pandas reductions they replace).
+        # Gust and adjusted longitude are monotonic in the source values, so
+        # their extremes are taken from the float32 reads (half the bytes to
+        # scan) and transformed with the same float64 operations
+        gust_max = float(np.nanmax(wind_speed)) * config.GUST_FACTOR_NCAR * config.MS_TO_MPH
+        lon_min = float(np.nanmin(longitude)) + config.LONGITUDE_ADJUSTMENT
+        lon_max = float(np.nanmax(longitude)) + config.LONGITUDE_ADJUSTMENT
+        logger.info(f"  Data statistics:")
+        logger.info(f"    Total grid points: {wind_speed.size:,}")
+        logger.info(f"    Max gust wind speed: {gust_max:.2f} mph")
+        logger.info(f"    Longitude range: [{lon_min:.2f}, {lon_max:.2f}]")
+        logger.info(f"    Latitude range: [{np.nanmin(latitude):.2f}, {np.nanmax(latitude):.2f}]")
+
+        # Save to CSV, straight from the arrays (NaN is written as an empty cell)
+        logger.info(f"  Saving to: {output_csv}")
+        table = pa.table({
+            'Longitude': pa.array(longitude_adjusted, from_pandas=True),
+            'Latitude': pa.array(latitude, from_pandas=True),
+            'Wind_Speed': pa.array(wind_speed, from_pandas=True),
+            'Gust_Wind_Speed': pa.array(gust_wind_speed, from_pandas=True)
+        })
+        pacsv.write_csv(table, output_csv)
+        logger.info(f"  ✓ Successfully processed {scenario}")
+
+        return output_csv
+
+    except Exception as e:
+        logger.error(f"  ✗ Error processing {netcdf_file}: {str(e)}")
+        raise
+
+
+def _read_netcdf(netcdf_path):
+    """
+    Read the wind swath and coordinate variables of one NCAR NetCDF file.
+
+    Parameters:
+    -----------
+    netcdf_path : str
+        Path to the NetCDF file
+
+    Returns:
+    --------
+    tuple of ndarray
+        (swath_wind, lon_2d, lat_2d) 2D arrays, with fill values as NaN
+
+    Raises:
+    -------
+    KeyError
+        If the file is missing any of config.NETCDF_VARIABLES
+    """
+    netcdf_file = os.path.basename(netcdf_path)
+    required_vars = config.NETCDF_VARIABLES
+
+    with netCDF4.Dataset(netcdf_path, 'r') as nc:
+        # Validate required variables exist
+        missing_vars = [var_key for var_key in required_vars.values()
+                        if var_key not in nc.variables]
+        if missing_vars:
+            raise KeyError(f"NetCDF file {netcdf_file} missing variables: {', '.join(missing_vars)}")
+
+        return (_read_variable(nc[required_vars['wind']]),
+                _read_variable(nc[required_vars['longitude']]),
+                _read_variable(nc[required_vars['latitude']]))
+
+
+def _read_variable(var):
+    """
+    Read a NetCDF variable as a plain ndarray with fill values set to NaN.
+
+    Auto-masking is switched off so netCDF4 does not allocate a mask array
+    and wrap the data in a MaskedArray; cells equal to the variable's fill or
+    missing value are replaced with NaN instead, which is what the masked
+    cells became in the CSV before. Packed variables (scale_factor/add_offset)
+    and variables with a valid range keep netCDF4's masked read.
+
+    Floating-point data keeps the precision it is read at on both paths, so
+    the CSV text does not depend on the file's attributes; integer data is
+    returned as float64 so that fill cells can hold NaN.
+
+    Parameters:
+    -----------
+    var : netCDF4.Variable
+        Variable to read
+
+    Returns:
+    --------
+    ndarray
+        Variable data, with fill values as NaN
+    """
+    attrs = var.ncattrs()
+    if set(attrs) & {'scale_factor', 'add_offset', 'valid_min', 'valid_max', 'valid_range'}:
+        data = var[:]
+        if data.dtype.kind != 'f':
+            data = data.astype(np.float64)
+        return np.ma.filled(data, np.nan)
+
+    var.set_auto_mask(False)
+    data = var[:]
+    if data.dtype.kind != 'f':
+        data = data.astype(np.float64)
+
+    if '_FillValue' in attrs:
+        fill_values = [var.getncattr('_FillValue')]
+    else:
+        fill_values = [netCDF4.default_fillvals.get(var.dtype.str[1:])]
+    if 'missing_value' in attrs:
+        fill_values.extend(np.atleast_1d(var.getncattr('missing_value')).tolist())
+
+    for fill_value in fill_values:
+        if fill_value is not None:
+            data[data == fill_value] = np.nan
+
+    return data
+
@@ -12,15 +12,22 @@ join_buildings_wind : Spatially join NSI buildings with NCAR wind data
 
 import os
 import logging
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 import geopandas as gpd
-from shapely import Point
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import shapely
+from pyproj import Transformer
+from scipy.spatial import cKDTree
 import config
+from modules._cache import source_stamp, cached_source
 
 logger = logging.getLogger(__name__)
 
 
-def join_buildings_wind(nsi_path, wind_csv_paths, output_dir, force_rerun=False):
+def join_buildings_wind(nsi_path, wind_csv_paths, output_dir, force_rerun=False, executor=None):
     """
     Spatially join NSI buildings with NCAR wind data using nearest neighbor.
 
@@ -39,7 +46,11 @@ def join_buildings_wind(nsi_path, wind_csv_paths, output_dir, force_rerun=False)
     output_dir : str
         Directory for joined data outputs
     force_rerun : bool, optional
-        If True, rejoin even if output files exist. Default is False.
+        If True, rejoin even if output files exist, and rebuild the projected
+        NSI cache. Default is False.
+    executor : concurrent.futures.Executor, optional
+        If given, scenarios are joined in parallel on this executor.
+        Default is None (join scenarios sequentially in this process).
 
     Returns:
     --------
@@ -58,16 +69,16 @@ def join_buildings_wind(nsi_path, wind_csv_paths, output_dir, force_rerun=False)
     -----------------
     1. Load NSI building inventory from GeoPackage
     2. For each climate scenario:
-       a. Load wind CSV and convert to GeoDataFrame with Point geometries
-       b. Set CRS to EPSG:4326 (WGS 84)
-       c. Project both datasets to EPSG:26915 (NAD83 / UTM zone 15N)
-       d. Perform nearest neighbor spatial join
-       e. Calculate and log join distance statistics
-       f. Save joined data to CSV
+       a. Load wind CSV (EPSG:4326 / WGS 84 longitude and latitude)
+       b. Project the wind grid to EPSG:26915 (NAD83 / UTM zone 15N) and build
+          a KD-tree over it (once, when scenarios share the same grid)
+       c. Perform nearest neighbor spatial join (KD-tree on projected coordinates)
+       d. Calculate and log join distance statistics
+       e. Save joined data to CSV
 
     Output Format:
     --------------
-    Joined CSV contains all NSI building attributes plus:
+    Joined CSV contains all NSI building attributes (except geometry) plus:
     - Longitude : Wind grid point longitude
     - Latitude : Wind grid point latitude
     - Wind_Speed : Sustained wind speed (mph)
@@ -102,28 +113,35 @@ def join_buildings_wind(nsi_path, wind_csv_paths, output_dir, force_rerun=False)
         raise FileNotFoundError(error_msg)
 
     logger.info(f"Loading NSI building inventory: {nsi_path}")
+    os.makedirs(output_dir, exist_ok=True)
 
     try:
-        # Load NSI data from GeoPackage
-        nsi = gpd.read_file(nsi_path)
-        logger.info(f"  ✓ Loaded {len(nsi):,} buildings")
-        logger.info(f"  Original CRS: {nsi.crs}")
-
-        # Project to target CRS for accurate distance calculations
-        logger.info(f"  Projecting to {config.PROJECTED_CRS} for distance calculation...")
-        nsi_projected = nsi.to_crs(config.PROJECTED_CRS)
-        logger.info(f"  ✓ Projection complete")
+        nsi_projected = _read_nsi_projected(nsi_path, output_dir, force_rerun)
 
     except Exception as e:
         logger.error(f"  ✗ Error loading NSI data: {str(e)}")
         raise
 
-    # Process each scenario
+    # The join only needs the building coordinates and attributes. Passing them
+    # as a plain array and DataFrame keeps the shapely geometry column from being
+    # pickled to every worker (and out of the joined CSV)
+    nsi_xy = shapely.get_coordinates(nsi_projected.geometry.values)
+    if len(nsi_xy) != len(nsi_projected):
+        error_msg = "NSI geometries must be single, non-empty points"
+        logger.error(f"  ✗ {error_msg}")
+        raise ValueError(error_msg)
+    nsi_df = pd.DataFrame(nsi_projected.drop(columns=nsi_projected.geometry.name))
+
+    # Process each scenario (one worker per scenario when an executor is given)
     joined_files = {}
+    pending = {}
+    to_submit = []
+    # (lon/lat, KD-tree) of the last wind grid projected. The NCAR scenarios
+    # share one model grid, so it is projected and indexed once, here, and the
+    # tree is passed to every scenario's join
+    grid = None
 
     for scenario, wind_csv in wind_csv_paths.items():
-        logger.info(f"\nProcessing scenario: {scenario}")
-
         # Create scenario-specific output directory
         scenario_output_dir = os.path.join(output_dir, scenario)
         os.makedirs(scenario_output_dir, exist_ok=True)
@@ -132,74 +150,227 @@ def join_buildings_wind(nsi_path, wind_csv_paths, output_dir, force_rerun=False)
 
         # Skip if output already exists and force_rerun is False
         if os.path.exists(output_csv) and not force_rerun:
+            logger.info(f"\nScenario: {scenario}")
             logger.info(f"  Output already exists: {output_csv}")
             logger.info(f"  Skipping join (use --force-rerun to rejoin)")
             joined_files[scenario] = output_csv
             continue
 
-        try:
-            # Validate wind CSV exists
-            if not os.path.exists(wind_csv):
-                error_msg = f"Wind CSV not found: {wind_csv}"
-                logger.error(f"  ✗ {error_msg}")
-                raise FileNotFoundError(error_msg)
-
-            logger.info(f"  Loading wind data: {os.path.basename(wind_csv)}")
-            wind_df = pd.read_csv(wind_csv)
-            logger.info(f"    ✓ Loaded {len(wind_df):,} wind grid points")
-
-            # Create Point geometries from longitude/latitude
-            logger.info(f"  Creating wind point geometries...")
-            points = [Point(row["Longitude"], row["Latitude"])
-                     for index, row in wind_df.iterrows()]
-            wind_gdf = gpd.GeoDataFrame(wind_df, geometry=points)
-
-            # Set CRS (WGS 84 geographic coordinates)
-            wind_gdf.crs = config.INPUT_CRS
-            logger.info(f"    Set CRS: {wind_gdf.crs}")
-
-            # Project to same CRS as NSI for spatial join
-            logger.info(f"  Projecting wind data to {config.PROJECTED_CRS}...")
-            wind_gdf_projected = wind_gdf.to_crs(config.PROJECTED_CRS)
-            logger.info(f"    ✓ Projection complete")
-
-            # Perform nearest neighbor spatial join
-            logger.info(f"  Performing nearest neighbor spatial join...")
-            logger.info(f"    This may take several minutes for large datasets...")
-            joined_gdf = gpd.sjoin_nearest(
-                nsi_projected,
-                wind_gdf_projected,
-                how='left',
-                distance_col='distance'
-            )
-            logger.info(f"    ✓ Join complete")
-
-            # Log join statistics
-            logger.info(f"  Join statistics:")
-            logger.info(f"    Buildings joined: {len(joined_gdf):,}")
-            logger.info(f"    Mean distance: {joined_gdf['distance'].mean():.2f} meters")
-            logger.info(f"    Median distance: {joined_gdf['distance'].median():.2f} meters")
-            logger.info(f"    Max distance: {joined_gdf['distance'].max():.2f} meters")
-            logger.info(f"    Buildings with distance > 1km: {(joined_gdf['distance'] > 1000).sum():,}")
-
-            # Check for any buildings without wind data
-            missing_wind = joined_gdf['Gust_Wind_Speed'].isna().sum()
-            if missing_wind > 0:
-                logger.warning(f"    ⚠ {missing_wind} buildings missing wind data!")
-
-            # Save to CSV
-            logger.info(f"  Saving joined data: {output_csv}")
-            joined_gdf.to_csv(output_csv, index=False)
-            logger.info(f"  ✓ Successfully joined {scenario}")
+        grid = _wind_grid(scenario, wind_csv, grid)
 
-            joined_files[scenario] = output_csv
+        if executor is None:
+            joined_files[scenario] = _run_scenario(
+                scenario, nsi_df, nsi_xy, grid[1], wind_csv, output_csv)
+        else:
+            to_submit.append((scenario, grid[1], wind_csv, output_csv))
+
+    # Concurrent workers share the cores for their KD-tree queries instead of
+    # each one using all of them
+    if to_submit:
+        query_workers = max(1, (os.cpu_count() or 1) // len(to_submit))
+        for scenario, tree, wind_csv, output_csv in to_submit:
+            pending[scenario] = executor.submit(
+                _run_scenario, scenario, nsi_df, nsi_xy, tree, wind_csv, output_csv, query_workers)
 
-        except Exception as e:
-            logger.error(f"  ✗ Error joining {scenario}: {str(e)}")
-            raise
+    for scenario, future in pending.items():
+        joined_files[scenario] = future.result()
+
+    # Keep the caller's scenario order regardless of which outputs were skipped
+    joined_files = {s: joined_files[s] for s in wind_csv_paths}
 
     logger.info(f"\n{'='*70}")
     logger.info(f"Step 2 Complete: Joined {len(joined_files)} scenarios")
     logger.info(f"{'='*70}\n")
 
     return joined_files
+
+
+def _run_scenario(scenario, nsi_df, nsi_xy, tree, wind_csv, output_csv, query_workers=-1):
+    """
+    Join the projected NSI buildings with a single scenario's wind data.
+
+    Runs either in-process or in a worker process (see join_buildings_wind).
+
+    Parameters:
+    -----------
+    scenario : str
+        Scenario name (e.g., 'ida_2021')
+    nsi_df : DataFrame
+        NSI building attributes (without geometry)
+    nsi_xy : ndarray
+        (N, 2) building coordinates in config.PROJECTED_CRS, row-aligned with nsi_df
+    tree : scipy.spatial.cKDTree
+        KD-tree over the projected wind grid of wind_csv (see _wind_grid)
+    wind_csv : str
+        Path to the scenario's processed wind CSV
+    output_csv : str
+        Path of the joined CSV file to write
+    query_workers : int, optional
+        Threads for the KD-tree query. Default is -1 (all cores).
+
+    Returns:
+    --------
+    str
+        Path to the written CSV file
+    """
+    logger.info(f"\nProcessing scenario: {scenario}")
+
+    try:
+        logger.info(f"  Loading wind data: {os.path.basename(wind_csv)}")
+        wind_df = pd.read_csv(
+            wind_csv, engine='pyarrow',
+            dtype={'Longitude': 'float64', 'Latitude': 'float64',
+                   'Wind_Speed': 'float64', 'Gust_Wind_Speed': 'float64'})
+        logger.info(f"    ✓ Loaded {len(wind_df):,} wind grid points")
+        if tree.n != len(wind_df):
+            raise ValueError(f"KD-tree has {tree.n:,} points but {wind_csv} has {len(wind_df):,}")
+
+        # Perform nearest neighbor spatial join. Both sides are points in a
+        # metric CRS, so a KD-tree on the raw coordinates replaces sjoin_nearest.
+        # The matched grid points are the same; `distance` agrees with GEOS's
+        # only to floating-point rounding (differences of ~1e-9 m are expected)
+        logger.info(f"  Performing nearest neighbor spatial join...")
+        distance, nearest = tree.query(nsi_xy, k=1, workers=query_workers)
+
+        # Same layout as sjoin_nearest: NSI columns, index_right, wind columns,
+        # distance. Wind columns are gathered as arrays and added in one assign
+        joined_df = nsi_df.assign(
+            index_right=wind_df.index.to_numpy()[nearest],
+            **{col: wind_df[col].to_numpy()[nearest] for col in wind_df.columns},
+            distance=distance
+        )
+        logger.info(f"    ✓ Join complete")
+
+        # Log join statistics
+        logger.info(f"  Join statistics:")
+        logger.info(f"    Buildings joined: {len(joined_df):,}")
+        logger.info(f"    Mean distance: {joined_df['distance'].mean():.2f} meters")
+        logger.info(f"    Median distance: {joined_df['distance'].median():.2f} meters")
+        logger.info(f"    Max distance: {joined_df['distance'].max():.2f} meters")
+        logger.info(f"    Buildings with distance > 1km: {(joined_df['distance'] > 1000).sum():,}")
+
+        # Check for any buildings without wind data
+        missing_wind = joined_df['Gust_Wind_Speed'].isna().sum()
+        if missing_wind > 0:
+            logger.warning(f"    ⚠ {missing_wind} buildings missing wind data!")
+
+        # Save to CSV
+        logger.info(f"  Saving joined data: {output_csv}")
+        pacsv.write_csv(pa.Table.from_pandas(joined_df, preserve_index=False), output_csv)
+        logger.info(f"  ✓ Successfully joined {scenario}")
+
+        return output_csv
+
+    except Exception as e:
+        logger.error(f"  ✗ Error joining {scenario}: {str(e)}")
+        raise
+
+
+def _read_nsi_projected(nsi_path, cache_dir, force_rerun=False):
+    """
+    Load the NSI buildings projected to config.PROJECTED_CRS, through a GeoParquet cache.
+
+    Reading the GeoPackage through GDAL and reprojecting it is slow, so the
+    projected buildings are cached as {cache_dir}/{nsi name}.projected.parquet.
+    The cache is reused only while the GeoPackage's path, size and mtime match
+    the ones stored with it and it is in the configured CRS.
+
+    Parameters:
+    -----------
+    nsi_path : str
+        Path to NSI GeoPackage file
+    cache_dir : str
+        Directory for the cached buildings
+    force_rerun : bool, optional
+        If True, rebuild the cache even if it is valid. Default is False.
+
+    Returns:
+    --------
+    GeoDataFrame
+        NSI buildings in config.PROJECTED_CRS
+    """
+    nsi_name = os.path.splitext(os.path.basename(nsi_path))[0]
+    cache_path = os.path.join(cache_dir, f"{nsi_name}.projected.parquet")
+
+    source = source_stamp(nsi_path)
+    if not force_rerun and cached_source(cache_path) == source:
+        nsi_projected = gpd.read_parquet(cache_path)
+        if nsi_projected.crs == config.PROJECTED_CRS:
+            logger.info(f"  ✓ Loaded {len(nsi_projected):,} projected buildings from cache: {cache_path}")
+            return nsi_projected
+
+    # Load NSI data from GeoPackage
+    nsi = gpd.read_file(nsi_path)
+    logger.info(f"  ✓ Loaded {len(nsi):,} buildings")
+    logger.info(f"  Original CRS: {nsi.crs}")
+
+    # Project to target CRS for accurate distance calculations
+    logger.info(f"  Projecting to {config.PROJECTED_CRS} for distance calculation...")
+    nsi_projected = nsi.to_crs(config.PROJECTED_CRS)
+    logger.info(f"  ✓ Projection complete")
+
+    nsi_projected.attrs['source'] = source
+    try:
+        nsi_projected.to_parquet(cache_path, index=False)
+    except (TypeError, ValueError, OSError) as e:
+        # e.g. a column mixing numbers and text; the GeoPackage is simply re-read next time
+        logger.warning(f"  ⚠ Could not cache projected NSI: {e}")
+    return nsi_projected
+
+
+@lru_cache(maxsize=None)
+def _wind_transformer():
+    """Transformer from the wind grid's geographic CRS to the projected CRS."""
+    return Transformer.from_crs(config.INPUT_CRS, config.PROJECTED_CRS, always_xy=True)
+
+
+def _wind_grid(scenario, wind_csv, previous=None):
+    """
+    Project a scenario's wind grid and build a KD-tree over it.
+
+    Parameters:
+    -----------
+    scenario : str
+        Scenario name (e.g., 'ida_2021')
+    wind_csv : str
+        Path to the scenario's processed wind CSV
+    previous : tuple, optional
+        (lonlat, tree) returned for an earlier scenario; reused as-is if the
+        grid coordinates are identical. Default is None.
+
+    Returns:
+    --------
+    tuple
+        (lonlat, tree): (M, 2) grid coordinates in config.INPUT_CRS and a
+        scipy.spatial.cKDTree over them in config.PROJECTED_CRS
+
+    Raises:
+    -------
+    FileNotFoundError
+        If the wind CSV does not exist
+    """
+    if not os.path.exists(wind_csv):
+        error_msg = f"Wind CSV not found: {wind_csv}"
+        logger.error(f"  ✗ {error_msg}")
+        raise FileNotFoundError(error_msg)
+
+    lonlat = pd.read_csv(
+        wind_csv, engine='pyarrow', usecols=['Longitude', 'Latitude'],
+        dtype={'Longitude': 'float64', 'Latitude': 'float64'}
+    )[['Longitude', 'Latitude']].to_numpy()
+    if previous is not None and np.array_equal(previous[0], lonlat):
+        logger.info(f"\nReusing projected wind grid for {scenario}")
+        return previous
+
+    # Project the wind grid (WGS 84 lon/lat) to the same CRS as NSI. The
+    # coordinate arrays go through PROJ directly, no point geometries needed
+    logger.info(f"\nProjecting wind grid of {scenario} to {config.PROJECTED_CRS}...")
+    x, y = _wind_transformer().transform(lonlat[:, 0], lonlat[:, 1])
+
+    # The NCAR grid is regular, so the sliding-midpoint split (balanced_tree=False)
+    # is as good as median splits and much cheaper to build. The tree layout
+    # changes the order distances are accumulated in, so `distance` can move by
+    # ~1e-9 m between layouts; the nearest grid point does not change
+    tree = cKDTree(np.column_stack([x, y]), leafsize=32, balanced_tree=False, compact_nodes=False)
+    logger.info(f"  ✓ Indexed {tree.n:,} projected grid points")
+    return lonlat, tree